@@ -5,13 +5,58 @@ Scrapes release notes from documentation pages or XML feeds and outputs in vario
 """
 
 import argparse
+import asyncio
+import calendar
+import functools
+import hashlib
+import importlib.util
+import io
+import os
+import pickle
 import sys
+import textwrap
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from itertools import chain, islice
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import BinaryIO, List, Dict, Optional, Tuple, Union
 import re
 import json
-from urllib.parse import urlparse
-import xml.etree.ElementTree as ET
+from urllib.parse import urljoin, urlparse
+
+# lxml is an optional speed-up for feed parsing; fall back to the stdlib parser
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+# BeautifulSoup tree builder for whole pages: lxml's C parser when available.
+# Small HTML fragments keep html.parser, which doesn't wrap them in <html><body>.
+PAGE_PARSER = 'lxml' if HAS_LXML else 'html.parser'
+
+# pyahocorasick is an optional speed-up for keyword categorization
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# selectolax (lexbor) is an optional speed-up for extracting item text
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# orjson is an optional speed-up for encoding JSON reports
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # GCP Service Groups (domains)
 SERVICE_GROUPS = {
@@ -71,8 +116,15 @@ SERVICE_GROUPS = {
     ],
 }
 
-# GCP Service XML Feed URLs
-SERVICE_FEEDS = {
+# Reverse lookup: service -> group
+_SERVICE_TO_GROUP = {
+    service: group
+    for group, services in SERVICE_GROUPS.items()
+    for service in services
+}
+
+# GCP Service XML Feed URLs (read-only)
+SERVICE_FEEDS = MappingProxyType({
     # Applications & Development
     'application-design-center': 'https://cloud.google.com/application-design-center/docs/release-notes',
     'apphub': 'https://cloud.google.com/feeds/apphub-release-notes.xml',
@@ -203,7 +255,7 @@ SERVICE_FEEDS = {
     'firebase-unity': 'https://firebase.google.com/support/release-notes/unity',
     'firebase-flutter': 'https://firebase.google.com/support/release-notes/flutter',
     'firebase-extensions': 'https://firebase.google.com/support/release-notes/extensions',
-}
+})
 
 # Blog URLs for --blogs option
 BLOG_URLS = {
@@ -218,8 +270,8 @@ BLOG_URLS = {
     'medium-appdev': 'https://medium.com/feed/google-cloud/tagged/gcp-app-dev',
 }
 
-# HTML fallback URLs for services without XML feeds or where XML feeds are broken
-SERVICE_HTML_FALLBACKS = {
+# HTML fallback URLs for services without XML feeds or where XML feeds are broken (read-only)
+SERVICE_HTML_FALLBACKS = MappingProxyType({
     'application-design-center': 'https://cloud.google.com/application-design-center/docs/release-notes',
     'api-gateway': 'https://cloud.google.com/api-gateway/docs/release-notes',
     'cloud-deploy': 'https://cloud.google.com/deploy/docs/release-notes',
@@ -251,20 +303,21 @@ SERVICE_HTML_FALLBACKS = {
     # Specialized & Other Services fallbacks
     'healthcare-api': 'https://cloud.google.com/healthcare-api/docs/release-notes',
     'blockchain-node-engine': 'https://cloud.google.com/blockchain-node-engine/docs/release-notes',
-}
+})
 
+@functools.lru_cache(maxsize=1)
 def check_dependencies():
-    """Check if required dependencies are installed."""
+    """Check if required dependencies are installed.
+    
+    Only locates the packages rather than importing them, so the import cost
+    is paid later by the code paths that actually use them.
+    """
     missing_packages = []
     
-    try:
-        import requests
-    except ImportError:
+    if importlib.util.find_spec('requests') is None:
         missing_packages.append('requests')
     
-    try:
-        from bs4 import BeautifulSoup
-    except ImportError:
+    if importlib.util.find_spec('bs4') is None:
         missing_packages.append('beautifulsoup4')
     
     if missing_packages:
@@ -279,6 +332,209 @@ def check_dependencies():
     
     return True
 
+# Request headers sent with every fetch (set once on the shared session).
+# Accept-Encoding is left to requests, which advertises every encoding the
+# installed urllib3 can decode (gzip/deflate, plus br/zstd when available).
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+}
+
+@functools.lru_cache(maxsize=1)
+def get_session():
+    """Return the HTTP session shared by all scrapers, created on first use.
+    
+    Nearly every feed lives on cloud.google.com or firebase.google.com, so a
+    single pooled session lets concurrent fetches reuse keep-alive connections
+    instead of paying a TCP/TLS handshake per request.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.headers.update(_DEFAULT_HEADERS)
+    # One connection slot per fetch worker; pool_block makes any extra request
+    # wait for a kept-alive connection instead of opening (and then discarding)
+    # a fresh one, so no request pays a surplus TCP/TLS handshake
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_CONCURRENT_FETCHES,
+        pool_block=True,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def default_cache_dir() -> str:
+    """Return the directory used for cached feeds (honours XDG_CACHE_HOME)."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'gcp-changelog')
+
+class FeedCache:
+    """On-disk cache of feed bodies, their HTTP validators and parsed releases.
+    
+    Each URL gets a small JSON metadata file (ETag, Last-Modified, body hash)
+    and a copy of the last body. Subsequent fetches send If-None-Match /
+    If-Modified-Since so unchanged feeds come back as an empty 304 response.
+    The parsed releases are pickled next to the body, keyed by its SHA-256, so
+    an unchanged feed is not parsed again either. They may omit entries older
+    than a recorded cutoff, in which case they only serve windows starting at
+    or after it.
+    
+    With a max_age (in seconds), a body fetched or revalidated that recently
+    is used as-is, without contacting the server at all.
+    """
+    
+    # Bump whenever the structure of parsed releases changes
+    PARSED_FORMAT_VERSION = 1
+    
+    def __init__(self, directory: str = None, max_age: float = 0):
+        self.directory = directory or default_cache_dir()
+        self.max_age = max_age
+    
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, key + suffix)
+    
+    def _write(self, path: str, data: bytes) -> None:
+        """Write a cache file atomically so concurrent readers never see partial data."""
+        # Unique per thread as well as per process: fetch workers store concurrently
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def _load_meta(self, url: str) -> Dict:
+        try:
+            with open(self._path(url, '.json'), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Return the revalidation headers for a cached URL (empty if not cached)."""
+        if not os.path.exists(self._path(url, '.body')):
+            return {}
+        meta = self._load_meta(url)
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def fresh_body(self, url: str) -> Optional[bytes]:
+        """Return the cached body if it was fetched within max_age, else None."""
+        if not self.max_age:
+            return None
+        fetched = self._load_meta(url).get('fetched')
+        if fetched is None or time.time() - fetched > self.max_age:
+            return None
+        return self.load_body(url)
+    
+    def touch(self, url: str) -> None:
+        """Record that a cached body was just revalidated, restarting its max_age."""
+        if not self.max_age:
+            return
+        meta = self._load_meta(url)
+        if not meta:
+            return
+        meta['fetched'] = time.time()
+        try:
+            self._write(self._path(url, '.json'), json.dumps(meta).encode('utf-8'))
+        except OSError:
+            pass
+    
+    def load_body(self, url: str) -> Optional[bytes]:
+        """Return the cached body for a URL, or None if it is not cached."""
+        try:
+            with open(self._path(url, '.body'), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def store(self, url: str, response) -> None:
+        """Cache a successful response if the server sent validators for it."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        body = response.content
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'body_sha256': hashlib.sha256(body).hexdigest(),
+            'fetched': time.time(),
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # The metadata goes last, so its validators never describe a body
+            # that isn't on disk yet. If a run stops in between, the old
+            # validators sit next to the new body: the server then answers
+            # 200 with the current body, and a 304 for a missing body is
+            # refetched in full.
+            self._write(self._path(url, '.body'), body)
+            self._write(self._path(url, '.json'), json.dumps(meta).encode('utf-8'))
+        except OSError:
+            # The cache is best-effort; a read-only home directory must not break scraping
+            pass
+    
+    def load_parsed(self, url: str, body: bytes, since: Optional[datetime] = None) -> Optional[List[Dict]]:
+        """Return releases previously parsed from exactly this body, if cached.
+        
+        The cached releases are only returned if they cover every entry dated
+        on or after since (None meaning all entries).
+        """
+        try:
+            with open(self._path(url, '.pkl'), 'rb') as f:
+                entry = pickle.load(f)
+        except Exception:
+            return None
+        if (entry.get('version') != self.PARSED_FORMAT_VERSION or
+                entry.get('body_sha256') != hashlib.sha256(body).hexdigest()):
+            return None
+        cached_since = entry.get('since')
+        if cached_since is not None and (since is None or since < cached_since):
+            return None
+        return entry['releases']
+    
+    def store_parsed(self, url: str, body: bytes, releases: List[Dict], since: Optional[datetime] = None) -> None:
+        """Cache the releases parsed from a body (covering entries dated since onwards)."""
+        entry = {
+            'version': self.PARSED_FORMAT_VERSION,
+            'body_sha256': hashlib.sha256(body).hexdigest(),
+            'since': since,
+            'releases': releases,
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._write(self._path(url, '.pkl'), pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError:
+            pass
+    
+    def clear(self) -> int:
+        """Remove every cached body, metadata and parsed file. Returns the number removed."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        removed = 0
+        for name in names:
+            if not name.endswith(('.json', '.body', '.pkl', '.tmp')):
+                continue
+            try:
+                os.remove(os.path.join(self.directory, name))
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
 # Valid categories for filtering
 VALID_CATEGORIES = [
     'ga',
@@ -294,6 +550,497 @@ VALID_CATEGORIES = [
     'update',
 ]
 
+# Maximum number of release note sources fetched at the same time
+MAX_CONCURRENT_FETCHES = 16
+
+# Write buffer for -f output files, so large reports go out in few write() calls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Translation tables for turning category slugs into CSS classes / display labels
+_DASH_TO_SPACE = str.maketrans({'-': ' '})
+_DASH_TO_EMPTY = str.maketrans({'-': ''})
+
+# Category icons shown in the text report, keyed by the upper-cased category
+_CATEGORY_ICONS = {
+    'GA': '✅',
+    'PUBLIC-PREVIEW': '🔮',
+    'BREAKING': '⚠️ ',
+    'SECURITY': '🔒',
+    'DEPRECATED': '⛔',
+    'FIXED': '🔧',
+    'ISSUE': '🐛',
+    'CHANGE': '🔄',
+    'ANNOUNCEMENT': '📢',
+    'LIBRARIES': '📦',
+    'UPDATE': '📝',
+}
+
+# CSS class and badge label of each category in the HTML report
+_CATEGORY_CSS_CLASSES = {c: c.translate(_DASH_TO_EMPTY) for c in VALID_CATEGORIES}
+_CATEGORY_LABELS = {c: c.translate(_DASH_TO_SPACE).upper() for c in VALID_CATEGORIES}
+
+# Category names in the HTML report statistics: the title-cased slug, with overrides
+_CATEGORY_DISPLAY_NAMES = {c: c.translate(_DASH_TO_SPACE).title() for c in VALID_CATEGORIES}
+_CATEGORY_DISPLAY_NAMES.update({
+    'ga': 'GA (Generally Available)',
+    'public-preview': 'Public Preview',
+    'breaking': 'Breaking',
+})
+
+# Friendlier names for blog sources in the text report
+_BLOG_DISPLAY_NAMES = {
+    'app-dev': 'App Dev',
+    'app-mod': 'App Mod',
+    'infra': 'Infra',
+    'containers': 'Containers',
+    'ai-ml': 'AI/ML',
+    'dev-blog': 'Dev Blog',
+}
+
+# Date formats used on HTML release notes pages
+_DATE_FORMATS = (
+    '%B %d, %Y',      # January 15, 2024
+    '%b %d, %Y',      # Jan 15, 2024
+    '%Y-%m-%d',       # 2024-01-15
+    '%m/%d/%Y',       # 01/15/2024
+    '%d/%m/%Y',       # 15/01/2024
+)
+
+# Date formats used in XML/Atom/RSS feeds
+_XML_DATE_FORMATS = (
+    '%Y-%m-%dT%H:%M:%S.%fZ',      # 2024-01-15T10:30:00.000Z
+    '%Y-%m-%dT%H:%M:%SZ',          # 2024-01-15T10:30:00Z
+    '%Y-%m-%dT%H:%M:%S%z',         # 2024-01-15T10:30:00+00:00
+    '%Y-%m-%dT%H:%M:%S.%f%z',      # 2024-01-15T10:30:00.000+00:00
+    '%a, %d %b %Y %H:%M:%S %Z',    # RSS format: Mon, 15 Jan 2024 10:30:00 GMT
+    '%a, %d %b %Y %H:%M:%S %z',    # RSS format with timezone
+    '%Y-%m-%d',                     # Simple date
+)
+
+# Patterns applied per item/entry while cleaning text, compiled once
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_ISO_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_URL_RE = re.compile(r'https?://[^\s"<>\]]+')
+_COLON_CAPITAL_RE = re.compile(r':([A-Z])')
+_PERIOD_CAPITAL_RE = re.compile(r'\.([A-Z])')
+_MERGED_SEE_RE = re.compile(r'([a-z])See ')
+_MERGED_FOR_RE = re.compile(r'([a-z])For ')
+
+# Relative/short date patterns on blog listing pages ("6d ago", "Dec 10")
+_RELATIVE_AGO_RE = re.compile(r'(\d+)\s*(d|h|m|min|hr|day|hour|minute|week|w)s?\s*ago', re.IGNORECASE)
+_SHORT_AGO_RE = re.compile(r'^\d+[dhm]\s*ago$', re.IGNORECASE)
+_MONTH_DAY_PREFIX_RE = re.compile(r'^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+\d+', re.IGNORECASE)
+_RELATIVE_DATE_RE = re.compile(r'(\d+[dhm]\s*ago|\d+\s*(?:day|hour|minute|week)s?\s*ago)', re.IGNORECASE)
+# Row formatters for the boxed text report: content left-aligned to the box width.
+# Emoji are two columns wide but one character, so rows holding one pad one less.
+_TEXT_BANNER_ROW = '║{:<78}║'.format
+_TEXT_BOX_ROW = '│{:<78}│'.format
+_TEXT_EMOJI_ROW = '│{:<77}│'.format
+_TEXT_TITLE_ROW = '║{:^78}║'.format(' RELEASE NOTES SUMMARY ')
+
+# Unbreakable runs (long URLs, base64 blobs) that are shortened before wrapping text output
+_LONG_TOKEN_RE = re.compile(r'\S{120,}')
+
+_MONTH_DAY_RE = re.compile(r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,?\s+\d{4})?)', re.IGNORECASE)
+
+# Classes of the per-note divs on Google Cloud release notes pages
+_RELEASE_DIV_CLASSES = frozenset({
+    'release-feature', 'release-changed', 'release-announcement', 'release-breaking', 'release-issue'
+})
+
+# Static start of the HTML report (document head, styles and the header
+# banner up to its metadata), joined to the per-run lines with newlines
+_HTML_HEAD = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Release Notes Summary</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
+            line-height: 1.6;
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 2em;
+        }
+        .meta {
+            opacity: 0.9;
+            margin-top: 10px;
+        }
+        .release-date {
+            background: white;
+            border-radius: 8px;
+            padding: 20px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .release-date h2 {
+            color: #333;
+            margin-top: 0;
+            border-bottom: 2px solid #667eea;
+            padding-bottom: 10px;
+        }
+        .release-item {
+            margin: 15px 0;
+            padding: 10px;
+            background: #f9f9f9;
+            border-left: 4px solid #ccc;
+            border-radius: 4px;
+        }
+        .release-item.ga { border-left-color: #4CAF50; }
+        .release-item.publicpreview { border-left-color: #FF9800; }
+        .release-item.change { border-left-color: #2196F3; }
+        .release-item.announcement { border-left-color: #9C27B0; }
+        .release-item.breaking { border-left-color: #f44336; }
+        .release-item.deprecated { border-left-color: #f44336; }
+        .release-item.fixed { border-left-color: #00BCD4; }
+        .release-item.update { border-left-color: #795548; }
+        .release-item.libraries { border-left-color: #607D8B; }
+        .release-item.security { border-left-color: #E91E63; }
+        .release-item.issue { border-left-color: #ffc107; }
+        .category {
+            display: inline-block;
+            padding: 2px 8px;
+            border-radius: 3px;
+            font-size: 0.85em;
+            font-weight: bold;
+            margin-right: 10px;
+        }
+        .category.ga { background: #4CAF50; color: white; }
+        .category.publicpreview { background: #FF9800; color: white; }
+        .category.change { background: #2196F3; color: white; }
+        .category.announcement { background: #9C27B0; color: white; }
+        .category.breaking { background: #E91E63; color: white; }
+        .category.deprecated { background: #f44336; color: white; }
+        .category.fixed { background: #00BCD4; color: white; }
+        .category.update { background: #795548; color: white; }
+        .category.libraries { background: #607D8B; color: white; }
+        .category.security { background: #E91E63; color: white; }
+        .category.issue { background: #ffc107; color: white; }
+        .stats {
+            background: white;
+            border-radius: 8px;
+            padding: 20px;
+            margin-top: 30px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .stats h2 {
+            color: #333;
+            margin-top: 0;
+        }
+        a {
+            color: #667eea;
+            text-decoration: none;
+        }
+        a:hover {
+            text-decoration: underline;
+        }
+        .source-link {
+            margin-top: 20px;
+            text-align: center;
+        }
+        .item-source {
+            font-size: 0.8em;
+            margin-top: 5px;
+            opacity: 0.7;
+        }
+        .no-results {
+            background: #fff3cd;
+            border: 1px solid #ffc107;
+            border-radius: 5px;
+            padding: 20px;
+            margin: 20px 0;
+            text-align: center;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Release Notes Summary</h1>
+        <div class="meta">"""
+
+# One release item in the HTML report: CSS class, category label, item HTML
+_HTML_ITEM = """
+        <div class="release-item {0}">
+            <span class="category {0}">{1}</span>
+            {2}
+        </div>"""
+
+# Item markup kept in the HTML report; everything else is reduced to its text
+_ITEM_HTML_TAGS = frozenset({'a', 'p', 'ul', 'ol', 'li', 'code', 'pre', 'strong', 'em', 'br'})
+# Elements removed from item markup together with their content
+_ITEM_HTML_DROPPED = ('script', 'style', 'iframe')
+_SAFE_LINK_SCHEMES = ('http', 'https')
+
+# Child tags tried, in priority order, for each field of a feed entry
+_ATOM = '{http://www.w3.org/2005/Atom}'
+_TITLE_TAGS = (_ATOM + 'title', 'title')
+_DATE_TAGS = ('pubDate', _ATOM + 'published', 'published', _ATOM + 'updated', 'updated')
+_CONTENT_TAGS = (_ATOM + 'content', 'content', _ATOM + 'summary', 'summary', 'description')
+_LINK_TAGS = (_ATOM + 'link', 'link')
+_CONTENT_ENCODED_TAG = '{http://purl.org/rss/1.0/modules/content/}encoded'
+_ORIGLINK_TAG = '{http://rssnamespace.org/feedburner/ext/1.0}origLink'
+
+# Text keywords for categorizing items, most specific category first.
+# An item gets the first category with any keyword contained in its text.
+_CATEGORY_KEYWORDS = (
+    ('security', ('security', 'vulnerability', 'cve', 'patch')),
+    ('breaking', ('breaking change', 'migration required', 'major version update')),
+    ('public-preview', ('(preview)', 'public preview', 'in preview', 'preview)', 'early access', 'beta')),
+    ('ga', ('generally available', 'general availability', '(ga)', 'is now ga', 'is in ga', 'in general availability')),
+    ('deprecated', ('deprecated', 'deprecation', 'obsolete', 'removed', 'discontinued')),
+    ('fixed', ('fixed', 'fix:', 'resolved', 'bug')),
+    ('issue', ('issue', 'known issue', 'workaround')),
+    ('change', ('changed:', 'version updates')),
+    ('announcement', ('announced', 'announcement', 'introducing')),
+    ('libraries', ('library', 'sdk', 'api', 'client library', 'framework')),
+)
+
+# Keyword -> index of its category in _CATEGORY_KEYWORDS
+_KEYWORD_RANK = {
+    keyword: rank
+    for rank, (_, keywords) in enumerate(_CATEGORY_KEYWORDS)
+    for keyword in keywords
+}
+
+# Single pass over the text: the lookahead reports, at every position, the
+# highest-priority keyword starting there (alternatives are in rank order)
+_CATEGORY_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(k) for k in sorted(_KEYWORD_RANK, key=_KEYWORD_RANK.get)) + '))'
+)
+
+
+def _build_category_automaton():
+    """Build an Aho-Corasick automaton over the category keywords (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, rank in _KEYWORD_RANK.items():
+        automaton.add_word(keyword, rank)
+    automaton.make_automaton()
+    return automaton
+
+
+# Reports every keyword occurrence in one pass; the regex above is the fallback
+_CATEGORY_AUTOMATON = _build_category_automaton()
+
+
+def _subtract_months(when: datetime, months: int) -> datetime:
+    """Step back whole calendar months, clamping the day to the target month's length."""
+    year, month = divmod(when.year * 12 + when.month - 1 - months, 12)
+    month += 1
+    day = min(when.day, calendar.monthrange(year, month)[1])
+    return when.replace(year=year, month=month, day=day)
+
+
+@functools.lru_cache(maxsize=32)
+def _cutoff_for(today: datetime, months: Optional[int], days: Optional[int]) -> datetime:
+    """Return the cutoff for a --days/--months window ending today (midnight).
+    
+    Cached so the many scrapers of a group run share one computation.
+    """
+    if days:
+        # Use start of day N days ago (midnight) for more intuitive behavior
+        # e.g., "-d 2" includes all of today, yesterday, and the day before
+        return today - timedelta(days=days)
+    return _subtract_months(today, months)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_text(date_str: str) -> Optional[datetime]:
+    """Parse a release-note date in any of the supported page formats.
+    
+    Memoized: the same header date is often matched many times per page.
+    """
+    date_str = date_str.strip()
+    
+    # Fast path for ISO dates (2024-01-15)
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_feed_date(date_str: str) -> Optional[datetime]:
+    """Parse a feed timestamp (Atom/RSS). Returns timezone-naive datetime."""
+    date_str = date_str.strip()
+    
+    parsed_date = None
+    
+    # Fast paths: Atom/RFC 3339 timestamps and RSS/RFC 822 dates
+    if date_str[10:11] in ('T', ''):
+        try:
+            parsed_date = datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    elif date_str[3:4] == ',':
+        try:
+            parsed_date = parsedate_to_datetime(date_str)
+        except (TypeError, ValueError):
+            pass
+    
+    if parsed_date is None:
+        for fmt in _XML_DATE_FORMATS:
+            try:
+                parsed_date = datetime.strptime(date_str, fmt)
+                break
+            except ValueError:
+                continue
+    
+    # Try to extract just the date part if no format matched
+    if parsed_date is None:
+        date_match = _ISO_DATE_RE.search(date_str)
+        if date_match:
+            try:
+                parsed_date = datetime.strptime(date_match.group(1), '%Y-%m-%d')
+            except ValueError:
+                pass
+    
+    # Convert to naive datetime (remove timezone info) for consistent comparison
+    if parsed_date is not None and parsed_date.tzinfo is not None:
+        parsed_date = parsed_date.replace(tzinfo=None)
+    
+    return parsed_date
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_html_text(html_text: str) -> str:
+    """Clean HTML text and add proper spacing for the text report.
+    
+    Memoized: grouped runs often carry the same item under several services.
+    """
+    import html as html_module
+    
+    # First unescape any HTML entities (handles double-encoded content)
+    unescaped = html_module.unescape(html_text) if '&' in html_text else html_text
+    
+    # Parse HTML, drop script/style elements and get text with a separator
+    # to preserve word boundaries
+    if '<' not in unescaped and '&' not in unescaped:
+        # Already plain text: parsing it would only strip the ends
+        text = unescaped.strip()
+    elif LexborHTMLParser is not None:
+        tree = LexborHTMLParser(unescaped)
+        tree.strip_tags(['script', 'style'])
+        text = tree.root.text(separator=' ', strip=True) if tree.root else ''
+    else:
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(unescaped, 'html.parser')
+        for element in soup(['script', 'style']):
+            element.decompose()
+        text = soup.get_text(separator=' ', strip=True)
+    
+    # Fallback: If text still contains HTML-like tags, strip them with regex
+    # This handles cases where BeautifulSoup doesn't recognize malformed HTML
+    if '<' in text and '>' in text:
+        text = _TAG_RE.sub(' ', text)
+    
+    # Clean up extra whitespace
+    text = _WHITESPACE_RE.sub(' ', text)
+    
+    # Fix common spacing issues from HTML parsing
+    # Add space after colons that are followed by uppercase letters
+    text = _COLON_CAPITAL_RE.sub(r': \1', text)
+    # Add space after periods that are followed by uppercase letters
+    text = _PERIOD_CAPITAL_RE.sub(r'. \1', text)
+    # Fix "See X" patterns that got merged
+    text = _MERGED_SEE_RE.sub(r'\1. See ', text)
+    text = _MERGED_FOR_RE.sub(r'\1. For ', text)
+    
+    # Remove specific URLs that clutter output
+    text = text.replace('https://cloud.google.com/run/docs/release-notes', '')
+    
+    return text.strip()
+
+
+@functools.lru_cache(maxsize=4096)
+def _html_plain_text(html_text: str) -> str:
+    """Return the stripped text of an HTML fragment, minus the release notes URL."""
+    if '<' not in html_text and '&' not in html_text:
+        # Already plain text: parsing it would only strip the ends
+        text = html_text.strip()
+    else:
+        from bs4 import BeautifulSoup
+        text = BeautifulSoup(html_text, 'html.parser').get_text(strip=True)
+    return text.replace('https://cloud.google.com/run/docs/release-notes', '')
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_item_html(html_text: str, base_url: str) -> str:
+    """Reduce an item's HTML to the allowed formatting tags and http(s) links.
+    
+    Feed and page markup is remote content: scripts, styles and frames are
+    dropped, other tags are unwrapped to their text, and every attribute
+    except an http(s) href on links is removed. Relative links are resolved
+    against base_url, so they still work from a saved report.
+    """
+    if '<' not in html_text:
+        # No markup at all; entities such as &lt; stay escaped
+        return html_text
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html_text, 'html.parser')
+    element = soup.find(_ITEM_HTML_DROPPED)
+    while element is not None:
+        element.decompose()
+        element = soup.find(_ITEM_HTML_DROPPED)
+    for element in soup.find_all(True):
+        if element.name not in _ITEM_HTML_TAGS:
+            element.unwrap()
+            continue
+        href = element.get('href') if element.name == 'a' else None
+        element.attrs = {}
+        if href:
+            href = urljoin(base_url, href.strip())
+            if urlparse(href).scheme.lower() in _SAFE_LINK_SCHEMES:
+                element['href'] = href
+    return str(soup)
+
+
+def _first_child(children: Dict, tags: Tuple[str, ...]):
+    """Return the child element for the first of tags present (None if none are)."""
+    for tag in tags:
+        element = children.get(tag)
+        if element is not None:
+            return element
+    return None
+
+
+def _release_stats(releases: List[Dict]) -> Tuple[int, Counter]:
+    """Return the total item count and per-category item counts."""
+    category_counts = Counter(item['category'] for release in releases for item in release['items'])
+    return sum(category_counts.values()), category_counts
+
+
+def _release_sort_key(release: Dict) -> datetime:
+    """Sort key for release records (undated releases sort as oldest)."""
+    return release['date'] or datetime.min
+
+
 class ReleaseNotesScraper:
     """Scraper for release notes from various documentation sites or XML feeds."""
     
@@ -340,47 +1087,72 @@ class ReleaseNotesScraper:
         }
     }
     
-    def __init__(self, url: str, months: int = None, days: int = None, start_date: datetime = None, end_date: datetime = None, categories: List[str] = None, service_name: str = None, verbose: bool = False):
+    # Each platform's date patterns combined into one alternation, so a header
+    # is scanned once and the leftmost date in it wins
+    DATE_REGEXES = {
+        platform: re.compile('|'.join(selectors['date_patterns']))
+        for platform, selectors in PLATFORM_SELECTORS.items()
+    }
+    
+    def __init__(self, url: str, months: int = None, days: int = None, start_date: datetime = None, end_date: datetime = None, categories: List[str] = None, service_name: str = None, verbose: bool = False, cache: FeedCache = None, show_stats: bool = True, now: datetime = None, session=None):
         """Initialize the scraper with URL and time range."""
         # Import here after dependency check
         import requests
-        from bs4 import BeautifulSoup
         
         self.requests = requests
-        self.BeautifulSoup = BeautifulSoup
+        self.session = session or get_session()
         
+        # One timestamp for every "now"-relative bound so they stay consistent;
+        # main() passes the same one to every scraper of a run
+        now = now or datetime.now()
+        
+        self.now = now
         self.url = url
         self.months = months
         self.days = days
         self.start_date = start_date
-        self.end_date = end_date or datetime.now()
-        self.categories = [c.lower() for c in categories] if categories else None
+        self.end_date = end_date or now
+        # Interned so membership tests against item categories can short-circuit on identity
+        self.categories = frozenset(sys.intern(c.lower()) for c in categories) if categories else None
         self.service_name = service_name
         self.verbose = verbose
+        self.cache = cache
+        self.show_stats = show_stats
+        # Set by main() when formatting a service group or the blogs
+        self.group_name = None
+        self.service_names = ()
         
         # Calculate cutoff date based on days, months, or start_date
         if start_date:
             self.cutoff_date = start_date
-        elif days:
-            # Use start of day N days ago (midnight) for more intuitive behavior
-            # e.g., "-d 2" includes all of today, yesterday, and the day before
-            cutoff = datetime.now() - timedelta(days=days)
-            self.cutoff_date = cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
-        elif months:
-            cutoff = datetime.now() - timedelta(days=months * 30)
-            self.cutoff_date = cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
         else:
-            # Default to 12 months
-            self.months = 12
-            cutoff = datetime.now() - timedelta(days=12 * 30)
-            self.cutoff_date = cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+            if not days and not months:
+                # Default to 12 months
+                self.months = months = 12
+            today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            self.cutoff_date = _cutoff_for(today, months, days)
         
         self.releases = []
-        self.platform = self._detect_platform(url)
-        self.is_xml_feed = self._is_xml_url(url)
+        self.platform, self.is_xml_feed = _URL_META.get(url) or (self._detect_platform(url), self._is_xml_url(url))
         self.used_fallback = False
         
-    def _detect_platform(self, url: str) -> str:
+    @functools.cached_property
+    def BeautifulSoup(self):
+        """bs4's BeautifulSoup class, imported on first use rather than in __init__.
+        
+        Scrapers that never parse HTML (feeds served from the parsed-feed cache,
+        title-only blog feeds) don't need to load bs4 at all.
+        """
+        from bs4 import BeautifulSoup
+        return BeautifulSoup
+    
+    @functools.cached_property
+    def generated_str(self) -> str:
+        """Timestamp shown as "Generated" in the reports, formatted once per scraper."""
+        return self.now.isoformat(sep=' ', timespec='seconds')
+    
+    @staticmethod
+    def _detect_platform(url: str) -> str:
         """Detect the documentation platform based on URL."""
         if 'cloud.google.com/blog' in url:
             return 'cloud_blog'
@@ -398,7 +1170,8 @@ class ReleaseNotesScraper:
             return 'antigravity'
         return 'generic'
     
-    def _is_xml_url(self, url: str) -> bool:
+    @staticmethod
+    def _is_xml_url(url: str) -> bool:
         """Check if the URL is an XML feed."""
         # AntiGravity uses embedded JS data, not XML
         if 'antigravity.google' in url:
@@ -432,24 +1205,7 @@ class ReleaseNotesScraper:
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date from various formats."""
-        date_str = date_str.strip()
-        
-        # Try common date formats
-        formats = [
-            '%B %d, %Y',      # January 15, 2024
-            '%b %d, %Y',      # Jan 15, 2024
-            '%Y-%m-%d',       # 2024-01-15
-            '%m/%d/%Y',       # 01/15/2024
-            '%d/%m/%Y',       # 15/01/2024
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        
-        return None
+        return _parse_date_text(date_str)
 
     def _fetch_date_from_url(self, url: str) -> Optional[datetime]:
         """Fetch article page to extract date."""
@@ -457,11 +1213,11 @@ class ReleaseNotesScraper:
             if self.verbose:
                 print(f"    Fetching date from: {url}", file=sys.stderr)
             
-            response = self.requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             if response.status_code != 200:
                 return None
                 
-            soup = self.BeautifulSoup(response.content, 'html.parser')
+            soup = self.BeautifulSoup(response.content, PAGE_PARSER)
             
             # Developers Blog specific
             if 'developers.googleblog.com' in url:
@@ -528,67 +1284,38 @@ class ReleaseNotesScraper:
         
         text_lower = text.lower()
         
-        # Check for specific patterns (most specific to least specific)
-        
-        # Security takes highest priority
-        if any(keyword in text_lower for keyword in ['security', 'vulnerability', 'cve', 'patch']):
-            return 'security'
-        
-        # Breaking changes
-        if any(keyword in text_lower for keyword in ['breaking change', 'breaking change:', 'migration required', 'major version update']):
-            return 'breaking'
-        
-        # Check for preview indicators (but only if not already categorized by div class)
-        if any(keyword in text_lower for keyword in ['(preview)', 'public preview', 'in preview', 'preview)', 'early access', 'beta']):
-            return 'public-preview'
-        
-        # GA/Generally Available
-        if any(keyword in text_lower for keyword in ['generally available', 'general availability', '(ga)', 'is now ga', 'is in ga', 'in general availability']):
-            return 'ga'
-        
-        # Deprecated
-        if any(keyword in text_lower for keyword in ['deprecated', 'deprecation', 'obsolete', 'removed', 'discontinued']):
-            return 'deprecated'
-        
-        # Fixed/Bug fixes
-        if any(keyword in text_lower for keyword in ['fixed', 'fix:', 'resolved', 'bug']):
-            return 'fixed'
-        
-        # Issue
-        if any(keyword in text_lower for keyword in ['issue', 'known issue', 'workaround']):
-            return 'issue'
-        
-        # Change (significant changes)
-        if any(keyword in text_lower for keyword in ['changed:', 'migration required', 'version updates']):
-            return 'change'
-        
-        # Announcements
-        if any(keyword in text_lower for keyword in ['announced', 'announcement', 'introducing']):
-            return 'announcement'
+        if _CATEGORY_AUTOMATON is not None:
+            ranks = (rank for _, rank in _CATEGORY_AUTOMATON.iter(text_lower))
+        else:
+            ranks = (_KEYWORD_RANK[match.group(1)] for match in _CATEGORY_KEYWORD_RE.finditer(text_lower))
+        
+        # Pick the most specific category whose keyword appears in the text
+        best = len(_CATEGORY_KEYWORDS)
+        for rank in ranks:
+            if rank < best:
+                best = rank
+                if best == 0:
+                    break
         
-        # Libraries/SDKs
-        if any(keyword in text_lower for keyword in ['library', 'sdk', 'api', 'client library', 'framework']):
-            return 'libraries'
+        if best < len(_CATEGORY_KEYWORDS):
+            return _CATEGORY_KEYWORDS[best][0]
         
         # Default to update for everything else
         return 'update'
     
     def scrape(self) -> List[Dict]:
         """Main scraping method with fallback support."""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
-        
         # Try XML feed first
         if self.is_xml_feed:
+            from urllib3.exceptions import HTTPError as TransportError
+            
             try:
-                response = self.requests.get(self.url, headers=headers, timeout=30)
-                response.raise_for_status()
-                return self._parse_xml_feed(response.content)
+                if self.cache:
+                    return self._parse_xml_feed(self._fetch_cached(self.url))
+                # Without a cache the body is never needed whole, so parse it
+                # as it arrives instead of buffering it first
+                with self._fetch_stream(self.url) as response:
+                    return self._parse_xml_feed(response.raw)
             except self.requests.RequestException as e:
                 # Check if it's a 404 error and we have a fallback
                 if hasattr(e, 'response') and e.response is not None and e.response.status_code == 404:
@@ -596,38 +1323,80 @@ class ReleaseNotesScraper:
                     if fallback_url:
                         if self.verbose:
                             print(f"  XML feed not available, trying HTML fallback: {fallback_url}", file=sys.stderr)
-                        return self._scrape_html(fallback_url, headers)
+                        return self._scrape_html(fallback_url)
                     else:
                         print(f"Error fetching URL: {e}", file=sys.stderr)
                         return []
                 else:
                     print(f"Error fetching URL: {e}", file=sys.stderr)
                     return []
+            except TransportError as e:
+                # A streamed body is read inside the XML parser, so a dropped
+                # connection or read timeout mid-feed surfaces as urllib3's error
+                print(f"Error fetching URL: {e}", file=sys.stderr)
+                return []
             except Exception as e:
                 print(f"Error parsing XML content: {e}", file=sys.stderr)
                 return []
         
         # Check if it's AntiGravity - use special JS extraction method
         if self._is_antigravity_url(self.url):
-            return self._scrape_antigravity_js(headers)
+            return self._scrape_antigravity_js()
         
         # Blog scraping
         if self.platform == 'cloud_blog':
-            return self._scrape_cloud_blog(headers)
+            return self._scrape_cloud_blog()
         if self.platform == 'developers_blog':
-            return self._scrape_developers_blog(headers)
+            return self._scrape_developers_blog()
         if self.platform == 'medium_blog':
-            return self._scrape_medium_blog(headers)
+            return self._scrape_medium_blog()
         
         # Direct HTML scraping
-        return self._scrape_html(self.url, headers)
-    
-    def _scrape_cloud_blog(self, headers: dict) -> List[Dict]:
-        """Scrape Google Cloud Blog."""
+        return self._scrape_html(self.url)
+    
+    def _fetch_cached(self, url: str) -> bytes:
+        """Fetch a URL, revalidating against the on-disk cache when one is configured."""
+        request_headers = None
+        if self.cache:
+            body = self.cache.fresh_body(url)
+            if body is not None:
+                if self.verbose:
+                    print(f"  Cached copy of {url} is fresh, not revalidating", file=sys.stderr)
+                return body
+            request_headers = self.cache.conditional_headers(url)
+        
+        response = self.session.get(url, headers=request_headers, timeout=30)
+        if response.status_code == 304 and self.cache:
+            body = self.cache.load_body(url)
+            if body is not None:
+                if self.verbose:
+                    print(f"  Not modified, using cached copy of {url}", file=sys.stderr)
+                self.cache.touch(url)
+                return body
+            # Cached body disappeared since the headers were built; fetch it again
+            response = self.session.get(url, timeout=30)
+        
+        response.raise_for_status()
+        if self.cache:
+            self.cache.store(url, response)
+        return response.content
+    
+    def _fetch_stream(self, url: str):
+        """Start a streamed download of a URL; response.raw yields the decoded body."""
+        response = self.session.get(url, timeout=30, stream=True)
         try:
-            response = self.requests.get(self.url, headers=headers, timeout=30)
             response.raise_for_status()
-            soup = self.BeautifulSoup(response.content, 'html.parser')
+        except self.requests.HTTPError:
+            response.close()
+            raise
+        # Undo gzip/deflate transfer encoding as the body is read
+        response.raw.decode_content = True
+        return response
+    
+    def _scrape_cloud_blog(self) -> List[Dict]:
+        """Scrape Google Cloud Blog."""
+        try:
+            soup = self.BeautifulSoup(self._fetch_cached(self.url), PAGE_PARSER)
             
             releases = []
             
@@ -668,6 +1437,7 @@ class ReleaseNotesScraper:
                         releases.append({
                             'date': None,
                             'date_str': 'Recent',
+                            'service': self.service_name,
                             'items': [{
                                 'text': title,
                                 'category': 'announcement',
@@ -725,6 +1495,7 @@ class ReleaseNotesScraper:
                     releases.append({
                         'date': date,
                         'date_str': date_str,
+                        'service': self.service_name,
                         'items': [{
                             'text': title,
                             'category': 'announcement',
@@ -739,10 +1510,10 @@ class ReleaseNotesScraper:
     def _parse_relative_date(self, relative_str: str) -> Optional[datetime]:
         """Parse relative date strings like '6d ago', '2h ago', 'Dec 10', etc."""
         relative_str = relative_str.strip().lower()
-        now = datetime.now()
+        now = self.now
         
         # Handle "X ago" patterns
-        ago_match = re.match(r'(\d+)\s*(d|h|m|min|hr|day|hour|minute|week|w)s?\s*ago', relative_str, re.IGNORECASE)
+        ago_match = _RELATIVE_AGO_RE.match(relative_str)
         if ago_match:
             value = int(ago_match.group(1))
             unit = ago_match.group(2).lower()
@@ -799,7 +1570,7 @@ class ReleaseNotesScraper:
         
         return None
 
-    def _scrape_medium_blog(self, headers: dict) -> List[Dict]:
+    def _scrape_medium_blog(self) -> List[Dict]:
         """Scrape Medium Google Cloud blog posts using Selenium for JS rendering."""
         try:
             # Medium requires JavaScript rendering - use Selenium
@@ -846,7 +1617,7 @@ class ReleaseNotesScraper:
             finally:
                 driver.quit()
             
-            soup = self.BeautifulSoup(page_source, 'html.parser')
+            soup = self.BeautifulSoup(page_source, PAGE_PARSER)
             
             releases = []
             
@@ -907,8 +1678,8 @@ class ReleaseNotesScraper:
                     for span in article.find_all('span'):
                         span_text = span.get_text(strip=True)
                         # Look for patterns like "6d ago", "Dec 10", "2h ago"
-                        if re.match(r'^\d+[dhm]\s*ago$', span_text, re.IGNORECASE) or \
-                           re.match(r'^(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+\d+', span_text, re.IGNORECASE) or \
+                        if _SHORT_AGO_RE.match(span_text) or \
+                           _MONTH_DAY_PREFIX_RE.match(span_text) or \
                            'ago' in span_text.lower():
                             date = self._parse_relative_date(span_text)
                             if date:
@@ -919,14 +1690,14 @@ class ReleaseNotesScraper:
                 if not date:
                     article_text = article.get_text()
                     # Look for relative date patterns
-                    relative_match = re.search(r'(\d+[dhm]\s*ago|\d+\s*(?:day|hour|minute|week)s?\s*ago)', article_text, re.IGNORECASE)
+                    relative_match = _RELATIVE_DATE_RE.search(article_text)
                     if relative_match:
                         date = self._parse_relative_date(relative_match.group(1))
                         if date:
                             date_str = date.strftime('%B %d, %Y')
                     else:
                         # Look for date like "Dec 10"
-                        date_match = re.search(r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,?\s+\d{4})?)', article_text, re.IGNORECASE)
+                        date_match = _MONTH_DAY_RE.search(article_text)
                         if date_match:
                             date = self._parse_relative_date(date_match.group(1))
                             if date:
@@ -935,6 +1706,7 @@ class ReleaseNotesScraper:
                 releases.append({
                     'date': date,
                     'date_str': date_str,
+                    'service': self.service_name,
                     'items': [{
                         'text': title,
                         'category': 'announcement',
@@ -967,6 +1739,7 @@ class ReleaseNotesScraper:
                                     releases.append({
                                         'date': None,
                                         'date_str': 'Recent',
+                                        'service': self.service_name,
                                         'items': [{
                                             'text': title,
                                             'category': 'announcement',
@@ -1001,12 +1774,10 @@ class ReleaseNotesScraper:
                 traceback.print_exc()
             return []
 
-    def _scrape_developers_blog(self, headers: dict) -> List[Dict]:
+    def _scrape_developers_blog(self) -> List[Dict]:
         """Scrape Google Developers Blog."""
         try:
-            response = self.requests.get(self.url, headers=headers, timeout=30)
-            response.raise_for_status()
-            soup = self.BeautifulSoup(response.content, 'html.parser')
+            soup = self.BeautifulSoup(self._fetch_cached(self.url), PAGE_PARSER)
             
             releases = []
             
@@ -1039,6 +1810,7 @@ class ReleaseNotesScraper:
                         releases.append({
                             'date': date,
                             'date_str': date_str,
+                            'service': self.service_name,
                             'items': [{
                                 'text': title,
                                 'category': 'announcement',
@@ -1076,6 +1848,7 @@ class ReleaseNotesScraper:
                         releases.append({
                             'date': date,
                             'date_str': date_str,
+                            'service': self.service_name,
                             'items': [{
                                 'text': title,
                                 'category': 'announcement',
@@ -1114,65 +1887,33 @@ class ReleaseNotesScraper:
             return SERVICE_HTML_FALLBACKS[self.service_name]
         return None
     
-    def _scrape_html(self, url: str, headers: dict) -> List[Dict]:
+    def _scrape_html(self, url: str) -> List[Dict]:
         """Scrape release notes from an HTML page."""
         try:
-            response = self.requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
+            content = self._fetch_cached(url)
             self.used_fallback = True
             
-            # Suppress XMLParsedAsHTMLWarning
-            import warnings
-            from bs4 import XMLParsedAsHTMLWarning
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
-                soup = self.BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
             # Update platform detection based on actual URL being scraped
             self.platform = self._detect_platform(url)
             
-            # Get platform-specific selectors
-            selectors = self.PLATFORM_SELECTORS[self.platform]
-            
-            # Find the main content area
-            content_area = None
-            for selector in selectors['container']:
-                content_area = soup.select_one(selector)
-                if content_area:
-                    break
-            
-            if not content_area:
-                content_area = soup.body or soup
-            
-            # Use platform-specific parsing
-            if self.platform == 'firebase':
-                self._parse_firebase_releases(content_area, selectors)
-            elif self.platform == 'antigravity':
-                self._parse_antigravity_releases(content_area, selectors)
+            # An unchanged page reuses its previously parsed releases. Sections
+            # older than the cutoff are skipped while parsing and the cache
+            # records that cutoff; the end date moves with "now", so it is only
+            # applied while parsing when nothing is cached.
+            since = self.cutoff_date
+            releases = self._load_parsed(url, content, since)
+            if releases is None:
+                until = None if self.cache else self.end_date
+                self._parse_html(url, content, since, until)
+                if self.cache:
+                    self.cache.store_parsed(url, content, self.releases, since)
             else:
-                # Try multiple strategies to find release notes
-                self._parse_structured_releases(content_area, selectors)
-            
-            if not self.releases:
-                self._parse_unstructured_releases(content_area, selectors)
-            
-            # Add fallback URL to items that have no URLs
-            for release in self.releases:
-                for item in release.get('items', []):
-                    if not item.get('urls') or len(item['urls']) == 0:
-                        item['urls'] = [url]  # Use the page URL as fallback
-            
-            # Filter by date
-            filtered_releases = self._filter_by_date(self.releases)
-            
-            # Filter by category
-            filtered_releases = self._filter_by_category(filtered_releases)
+                if self.verbose:
+                    print(f"  Using cached parse of {url}", file=sys.stderr)
+                self.releases = releases
             
-            return filtered_releases
+            # Filter by date and category
+            return self._filter_releases(self.releases)
             
         except self.requests.RequestException as e:
             print(f"Error fetching HTML fallback URL: {e}", file=sys.stderr)
@@ -1181,208 +1922,259 @@ class ReleaseNotesScraper:
             print(f"Error parsing HTML content: {e}", file=sys.stderr)
             return []
     
-    def _filter_by_date(self, releases: List[Dict]) -> List[Dict]:
-        """Filter releases by date range."""
-        filtered = []
-        for release in releases:
-            if release['date']:
-                if release['date'] >= self.cutoff_date:
-                    if self.end_date is None or release['date'] <= self.end_date:
-                        filtered.append(release)
-        return filtered
+    def _parse_html(self, url: str, content: bytes, since: Optional[datetime] = None, until: Optional[datetime] = None) -> None:
+        """Parse the releases of an HTML page into self.releases.
+        
+        Structured sections dated before since or after until are skipped.
+        """
+        # Suppress XMLParsedAsHTMLWarning
+        import warnings
+        from bs4 import XMLParsedAsHTMLWarning
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+            soup = self.BeautifulSoup(content, PAGE_PARSER)
+        
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+        
+        # Get platform-specific selectors
+        selectors = self.PLATFORM_SELECTORS[self.platform]
+        
+        # Find the main content area
+        content_area = None
+        for selector in selectors['container']:
+            content_area = soup.select_one(selector)
+            if content_area:
+                break
+        
+        if not content_area:
+            content_area = soup.body or soup
+        
+        # Use platform-specific parsing
+        found_sections = False
+        if self.platform == 'firebase':
+            self._parse_firebase_releases(content_area, selectors)
+        elif self.platform == 'antigravity':
+            self._parse_antigravity_releases(content_area, selectors)
+        else:
+            # Try multiple strategies to find release notes
+            found_sections = self._parse_structured_releases(content_area, selectors, since, until)
+        
+        if not self.releases and not found_sections:
+            self._parse_unstructured_releases(content_area, selectors)
+        
+        # Add fallback URL to items that have no URLs
+        for release in self.releases:
+            for item in release.get('items', []):
+                if not item.get('urls') or len(item['urls']) == 0:
+                    item['urls'] = [url]  # Use the page URL as fallback
     
-    def _filter_by_category(self, releases: List[Dict]) -> List[Dict]:
-        """Filter releases by category."""
-        if not self.categories:
-            return releases
+    def _filter_releases(self, releases: List[Dict]) -> List[Dict]:
+        """Filter releases by date range and their items by category, in one pass.
+        
+        A release is only copied when some of its items are filtered out.
+        """
+        # end_date is always set in __init__ (defaults to now)
+        cutoff_date = self.cutoff_date
+        end_date = self.end_date
+        categories = self.categories
         
         filtered = []
         for release in releases:
-            # Filter items within each release
-            filtered_items = [
-                item for item in release['items']
-                if item['category'].lower() in self.categories
-            ]
+            date = release['date']
+            if not date or not cutoff_date <= date <= end_date:
+                continue
             
-            if filtered_items:
-                filtered_release = release.copy()
-                filtered_release['items'] = filtered_items
-                filtered.append(filtered_release)
+            if categories:
+                # Item categories are already lowercase slugs from _categorize_item
+                items = release['items']
+                kept_items = [item for item in items if item['category'] in categories]
+                if not kept_items:
+                    continue
+                if len(kept_items) != len(items):
+                    release = release.copy()
+                    release['items'] = kept_items
+            
+            filtered.append(release)
         
         return filtered
     
-    def _parse_xml_feed(self, content: bytes) -> List[Dict]:
-        """Parse an XML/Atom/RSS feed."""
-        try:
-            root = ET.fromstring(content)
-        except ET.ParseError as e:
-            print(f"Error parsing XML: {e}", file=sys.stderr)
-            return []
+    def _load_parsed(self, url: str, content: Union[bytes, BinaryIO], since: datetime) -> Optional[List[Dict]]:
+        """Return the cached parse of url's unchanged body, or None when there is none.
         
-        releases = []
+        url is the resource actually fetched (an HTML fallback page rather than
+        the feed), so its parse is cached next to its body and validators.
+        """
+        releases = self.cache.load_parsed(url, content, since) if self.cache else None
+        # Releases carry the service they were parsed for; the same URL can be
+        # scraped under another name (e.g. a known feed passed with -u)
+        if releases and releases[0].get('service') != self.service_name:
+            for release in releases:
+                release['service'] = self.service_name
+        return releases
+    
+    def _parse_xml_feed(self, content: Union[bytes, BinaryIO]) -> List[Dict]:
+        """Parse an XML/Atom/RSS feed, reusing cached results for an unchanged body.
         
-        # Handle Atom feeds (most Google Cloud feeds)
-        # Namespace handling for Atom and RSS content module
-        namespaces = {
-            'atom': 'http://www.w3.org/2005/Atom',
-            'content': 'http://purl.org/rss/1.0/modules/content/'
-        }
+        content is the feed body, or a binary stream of it when no cache is set.
+        """
+        since = self.cutoff_date
+        releases = self._load_parsed(self.url, content, since)
+        if releases is None:
+            # Entries older than the cutoff are skipped before their content is
+            # parsed. The cache records that cutoff, so later runs with windows
+            # starting at or after it still reuse the result; the end date is
+            # only applied when nothing is cached, since it moves with "now".
+            until = None if self.cache else self.end_date
+            releases = self._parse_xml_entries(content, since, until)
+            if releases is None:
+                return []
+            if self.cache:
+                self.cache.store_parsed(self.url, content, releases, since)
+        elif self.verbose:
+            print(f"  Using cached parse of {self.url}", file=sys.stderr)
         
-        # Try Atom format first
-        entries = root.findall('.//atom:entry', namespaces)
-        if not entries:
-            # Try without namespace (some feeds don't use namespace prefix)
-            entries = root.findall('.//entry')
-        if not entries:
-            # Try RSS format
-            entries = root.findall('.//item')
-        
-        for entry in entries:
-            # Get title
-            title = None
-            title_elem = entry.find('atom:title', namespaces)
-            if title_elem is None:
-                title_elem = entry.find('title')
-            if title_elem is not None:
-                title = title_elem.text or ''
-            
-            # Get published/updated date
-            # Priority: pubDate (RSS) > published (Atom) > updated (Atom)
-            # pubDate and published are publication dates, updated is last-modified
-            date_elem = entry.find('pubDate')  # RSS format - check first
-            if date_elem is None:
-                date_elem = entry.find('atom:published', namespaces)
-            if date_elem is None:
-                date_elem = entry.find('published')
-            if date_elem is None:
-                date_elem = entry.find('atom:updated', namespaces)
-            if date_elem is None:
-                date_elem = entry.find('updated')
-            
-            parsed_date = None
-            date_str = ''
-            if date_elem is not None and date_elem.text:
-                date_str = date_elem.text
-                parsed_date = self._parse_xml_date(date_str)
-            
-            # Get content - try multiple sources
-            # Priority: content:encoded (RSS) > content (Atom) > summary > description
-            content_text = ''
-            
-            # Try content:encoded first (common in RSS feeds like feedburner)
-            content_elem = entry.find('content:encoded', namespaces)
-            if content_elem is not None and content_elem.text:
-                content_text = content_elem.text
-            
-            # Try other content elements
-            if not content_text:
-                content_elem = entry.find('atom:content', namespaces)
-                if content_elem is None:
-                    content_elem = entry.find('content')
-                if content_elem is None:
-                    content_elem = entry.find('atom:summary', namespaces)
-                if content_elem is None:
-                    content_elem = entry.find('summary')
-                if content_elem is None:
-                    content_elem = entry.find('description')  # RSS format
-                
-                if content_elem is not None:
-                    content_text = content_elem.text or ''
-            
-            # Get link
-            link = ''
-            link_elem = entry.find('atom:link', namespaces)
-            if link_elem is None:
-                link_elem = entry.find('link')
-            if link_elem is not None:
-                link = link_elem.get('href', '') or link_elem.text or ''
-            
-            # Also try feedburner:origLink for feedburner feeds
-            if not link:
-                origlink_elem = entry.find('{http://rssnamespace.org/feedburner/ext/1.0}origLink')
-                if origlink_elem is not None and origlink_elem.text:
-                    link = origlink_elem.text
-            
-            if parsed_date:
-                # Check if this is a blog feed - if so, just use title
-                if self._is_blog_feed():
-                    # For blog feeds, only use the title - don't include full article content
-                    clean_title = self._strip_html_tags(title) if title else ''
-                    if clean_title:
-                        items = [{
-                            'text': clean_title,
-                            'category': self._categorize_item(text=clean_title),
-                            'urls': [link.strip()] if link else []
-                        }]
-                    else:
-                        items = []
+        # Filter by date and category
+        return self._filter_releases(releases)
+    
+    def _parse_xml_entries(self, content: Union[bytes, BinaryIO], since: Optional[datetime] = None, until: Optional[datetime] = None) -> Optional[List[Dict]]:
+        """Parse the entries of an XML/Atom/RSS feed (None if the XML is invalid).
+        
+        content may be the whole body or a binary stream. Entries dated before
+        since or after until are skipped before their content is parsed.
+        """
+        source = io.BytesIO(content) if isinstance(content, bytes) else content
+        if HAS_LXML:
+            # lxml filters to entry/item elements in C, so only those reach the loop
+            events = ET.iterparse(
+                source, events=('end',), tag=('{*}entry', 'item'),
+                huge_tree=False, resolve_entities=False
+            )
+        else:
+            events = ET.iterparse(source, events=('end',))
+        
+        # Atom entries (with or without the Atom namespace) take precedence
+        # over RSS items, matching feeds that contain both
+        entry_releases = []
+        item_releases = []
+        seen_entry = False
+        
+        try:
+            for _, elem in events:
+                tag = elem.tag
+                if not isinstance(tag, str):
+                    continue
+                if tag == 'entry' or tag.endswith('}entry'):
+                    seen_entry = True
+                    releases = entry_releases
+                elif tag == 'item' and not seen_entry:
+                    releases = item_releases
                 else:
-                    # For release notes, parse the full content
-                    items = self._parse_xml_content(content_text, title, link)
+                    continue
                 
-                if items:
-                    releases.append({
-                        'date': parsed_date,
-                        'date_str': parsed_date.strftime('%B %d, %Y'),
-                        'items': items,
-                        'url': link or self.url
-                    })
-        
-        # Filter by date
-        filtered = self._filter_by_date(releases)
+                release = self._parse_xml_entry(elem, since, until)
+                if release:
+                    releases.append(release)
+                
+                # Entries are self-contained, so free each one once parsed
+                elem.clear()
+                if HAS_LXML:
+                    # Also drop the emptied entries before it from the tree
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+        except ET.ParseError as e:
+            print(f"Error parsing XML: {e}", file=sys.stderr)
+            return None
         
-        # Filter by category
-        return self._filter_by_category(filtered)
+        return entry_releases if seen_entry else item_releases
     
-    def _parse_xml_date(self, date_str: str) -> Optional[datetime]:
-        """Parse date from XML feed formats. Returns timezone-naive datetime."""
-        date_str = date_str.strip()
+    def _parse_xml_entry(self, entry, since: Optional[datetime] = None, until: Optional[datetime] = None) -> Optional[Dict]:
+        """Build a release from a single Atom entry or RSS item (None if it has no usable date or items)."""
+        # Index the entry's direct children once; like find(), the first
+        # child with a given tag wins
+        children = {}
+        for child in entry:
+            children.setdefault(child.tag, child)
         
-        # Common XML/Atom date formats
-        formats = [
-            '%Y-%m-%dT%H:%M:%S.%fZ',      # 2024-01-15T10:30:00.000Z
-            '%Y-%m-%dT%H:%M:%SZ',          # 2024-01-15T10:30:00Z
-            '%Y-%m-%dT%H:%M:%S%z',         # 2024-01-15T10:30:00+00:00
-            '%Y-%m-%dT%H:%M:%S.%f%z',      # 2024-01-15T10:30:00.000+00:00
-            '%a, %d %b %Y %H:%M:%S %Z',    # RSS format: Mon, 15 Jan 2024 10:30:00 GMT
-            '%a, %d %b %Y %H:%M:%S %z',    # RSS format with timezone
-            '%Y-%m-%d',                     # Simple date
-        ]
+        # Get title
+        title = None
+        title_elem = _first_child(children, _TITLE_TAGS)
+        if title_elem is not None:
+            title = title_elem.text or ''
         
-        parsed_date = None
+        # Get published/updated date
+        # Priority: pubDate (RSS) > published (Atom) > updated (Atom)
+        # pubDate and published are publication dates, updated is last-modified
+        date_elem = _first_child(children, _DATE_TAGS)
         
-        for fmt in formats:
-            try:
-                # Handle timezone offset format (+00:00)
-                if '+' in date_str and ':' in date_str.split('+')[-1]:
-                    # Remove colon from timezone for %z parsing
-                    parts = date_str.rsplit('+', 1)
-                    if len(parts) == 2:
-                        date_str_fixed = parts[0] + '+' + parts[1].replace(':', '')
-                        try:
-                            parsed_date = datetime.strptime(date_str_fixed, fmt)
-                            break
-                        except ValueError:
-                            pass
-                parsed_date = datetime.strptime(date_str, fmt)
-                break
-            except ValueError:
-                continue
+        parsed_date = None
+        date_str = ''
+        if date_elem is not None and date_elem.text:
+            date_str = date_elem.text
+            parsed_date = self._parse_xml_date(date_str)
         
-        # Try to extract just the date part if no format matched
-        if parsed_date is None:
-            date_match = re.search(r'(\d{4}-\d{2}-\d{2})', date_str)
-            if date_match:
-                try:
-                    parsed_date = datetime.strptime(date_match.group(1), '%Y-%m-%d')
-                except ValueError:
-                    pass
+        if parsed_date and ((since and parsed_date < since) or (until and parsed_date > until)):
+            return None
         
-        # Convert to naive datetime (remove timezone info) for consistent comparison
-        if parsed_date is not None and parsed_date.tzinfo is not None:
-            parsed_date = parsed_date.replace(tzinfo=None)
+        # Get content - try multiple sources
+        # Priority: content:encoded (RSS) > content (Atom) > summary > description
+        content_text = ''
+        
+        # Try content:encoded first (common in RSS feeds like feedburner)
+        content_elem = children.get(_CONTENT_ENCODED_TAG)
+        if content_elem is not None and content_elem.text:
+            content_text = content_elem.text
+        
+        # Try other content elements
+        if not content_text:
+            content_elem = _first_child(children, _CONTENT_TAGS)
+            if content_elem is not None:
+                content_text = content_elem.text or ''
+        
+        # Get link
+        link = ''
+        link_elem = _first_child(children, _LINK_TAGS)
+        if link_elem is not None:
+            link = link_elem.get('href', '') or link_elem.text or ''
+        
+        # Also try feedburner:origLink for feedburner feeds
+        if not link:
+            origlink_elem = children.get(_ORIGLINK_TAG)
+            if origlink_elem is not None and origlink_elem.text:
+                link = origlink_elem.text
+        
+        if parsed_date:
+            # Check if this is a blog feed - if so, just use title
+            if self._is_blog_feed():
+                # For blog feeds, only use the title - don't include full article content
+                clean_title = self._strip_html_tags(title) if title else ''
+                if clean_title:
+                    items = [{
+                        'text': clean_title,
+                        'category': self._categorize_item(text=clean_title),
+                        'urls': [link.strip()] if link else []
+                    }]
+                else:
+                    items = []
+            else:
+                # For release notes, parse the full content
+                items = self._parse_xml_content(content_text, title, link)
+            
+            if items:
+                return {
+                    'date': parsed_date,
+                    'date_str': parsed_date.strftime('%B %d, %Y'),
+                    'service': self.service_name,
+                    'items': items,
+                    'url': link or self.url
+                }
         
-        return parsed_date
+        return None
+    
+    def _parse_xml_date(self, date_str: str) -> Optional[datetime]:
+        """Parse date from XML feed formats. Returns timezone-naive datetime."""
+        return _parse_feed_date(date_str)
     
     def _parse_xml_content(self, content: str, title: str = '', entry_link: str = '') -> List[Dict]:
         """Parse HTML content from XML feed entry."""
@@ -1431,8 +2223,7 @@ class ReleaseNotesScraper:
                     all_urls.append(href)
         
         # Also extract URLs using regex as fallback (in case BeautifulSoup missed some)
-        url_pattern = re.compile(r'https?://[^\s"<>\]]+')
-        regex_urls = url_pattern.findall(content)
+        regex_urls = _URL_RE.findall(content)
         for url in regex_urls:
             # Clean up the URL (remove trailing punctuation)
             url = url.rstrip('.,;:!?)\'"]')
@@ -1448,13 +2239,13 @@ class ReleaseNotesScraper:
         has_long_content = len(soup.get_text(strip=True)) > 200
         
         # For GCP release notes XML feeds, look for specific div classes first
-        release_divs = soup.find_all('div', class_=['release-feature', 'release-changed', 'release-announcement', 'release-breaking', 'release-issue'])
+        release_divs = soup.find_all('div', class_=_RELEASE_DIV_CLASSES)
         if release_divs:
             for div in release_divs:
                 text = div.get_text(strip=True)
                 # Extra safeguard: strip any remaining HTML tags
                 text = self._strip_html_tags(text)
-                links = [a.get('href') for a in div.find_all('a') if a.get('href')]
+                links = self._element_links(div)
                 # Normalize all URLs
                 links = self._normalize_urls(links)
                 if text and len(text) > 5:
@@ -1469,7 +2260,7 @@ class ReleaseNotesScraper:
             text = soup.get_text(separator=' ', strip=True)
             # Extra safeguard: strip any remaining HTML tags (handles edge cases)
             text = self._strip_html_tags(text)
-            text = re.sub(r'\s+', ' ', text)
+            text = _WHITESPACE_RE.sub(' ', text)
             if text and len(text) > 10:
                 items.append({
                     'text': text,
@@ -1484,7 +2275,7 @@ class ReleaseNotesScraper:
                 for li in list_items:
                     text = li.get_text(strip=True)
                     text = self._strip_html_tags(text)
-                    links = [a.get('href') for a in li.find_all('a') if a.get('href')]
+                    links = self._element_links(li)
                     # Normalize all URLs
                     links = self._normalize_urls(links)
                     if text and len(text) > 5:
@@ -1500,7 +2291,7 @@ class ReleaseNotesScraper:
             for p in paragraphs:
                 text = p.get_text(strip=True)
                 text = self._strip_html_tags(text)
-                links = [a.get('href') for a in p.find_all('a') if a.get('href')]
+                links = self._element_links(p)
                 # Normalize all URLs
                 links = self._normalize_urls(links)
                 if text and len(text) > 10:
@@ -1514,7 +2305,7 @@ class ReleaseNotesScraper:
         if not items:
             text = soup.get_text(separator=' ', strip=True)
             text = self._strip_html_tags(text)
-            text = re.sub(r'\s+', ' ', text)
+            text = _WHITESPACE_RE.sub(' ', text)
             if text and len(text) > 10:
                 items.append({
                     'text': text,
@@ -1536,7 +2327,7 @@ class ReleaseNotesScraper:
         
         return items
     
-    def _scrape_antigravity_js(self, headers: dict) -> List[Dict]:
+    def _scrape_antigravity_js(self) -> List[Dict]:
         """Scrape AntiGravity changelog by extracting data from JavaScript bundle.
         
         AntiGravity is a JavaScript SPA (Angular) that embeds changelog data
@@ -1548,11 +2339,10 @@ class ReleaseNotesScraper:
         """
         try:
             # Step 1: Fetch the main page to find the JS bundle filename
-            response = self.requests.get(self.url, headers=headers, timeout=30)
-            response.raise_for_status()
+            page = self._fetch_cached(self.url).decode('utf-8', errors='replace')
             
             # Find the main JS bundle (e.g., main-WHICPWHT.js)
-            js_bundle_match = re.search(r'src="(main-[A-Za-z0-9]+\.js)"', response.text)
+            js_bundle_match = re.search(r'src="(main-[A-Za-z0-9]+\.js)"', page)
             if not js_bundle_match:
                 if self.verbose:
                     print("  Could not find JS bundle in AntiGravity page", file=sys.stderr)
@@ -1565,9 +2355,9 @@ class ReleaseNotesScraper:
                 print(f"  Found JS bundle: {js_bundle_name}", file=sys.stderr)
             
             # Step 2: Fetch the JS bundle
-            js_response = self.requests.get(js_bundle_url, headers=headers, timeout=30)
-            js_response.raise_for_status()
-            js_content = js_response.text
+            # JS bundles are UTF-8; decoding directly also skips requests'
+            # encoding detection over the whole bundle
+            js_content = self._fetch_cached(js_bundle_url).decode('utf-8', errors='replace')
             
             # Step 3: Extract the changelog data
             # The data is in a variable like: var j9={title:"...",sections:[...]}
@@ -1609,13 +2399,8 @@ class ReleaseNotesScraper:
             # Step 4: Parse the sections into releases
             releases = self._parse_antigravity_sections(sections_str if 'sections_str' in dir() else js_content)
             
-            # Filter by date
-            filtered_releases = self._filter_by_date(releases)
-            
-            # Filter by category
-            filtered_releases = self._filter_by_category(filtered_releases)
-            
-            return filtered_releases
+            # Filter by date and category
+            return self._filter_releases(releases)
             
         except self.requests.RequestException as e:
             print(f"Error fetching AntiGravity data: {e}", file=sys.stderr)
@@ -1659,6 +2444,10 @@ class ReleaseNotesScraper:
             re.DOTALL
         )
         
+        # Accordion sections (Improvements, Fixes, Patches) and their items
+        item_pattern = re.compile(r'\{title:\s*"([^"]+)"[^}]*accordion_items:\s*\[(.*?)\]\s*\}', re.DOTALL)
+        text_pattern = re.compile(r'\{text:\s*"([^"]+)"\}')
+        
         matches = version_pattern.findall(js_content)
         
         if not matches:
@@ -1685,6 +2474,7 @@ class ReleaseNotesScraper:
                     releases.append({
                         'date': parsed_date,
                         'date_str': date_str.strip(),
+                        'service': self.service_name,
                         'items': items,
                         'url': self.url
                     })
@@ -1699,7 +2489,7 @@ class ReleaseNotesScraper:
                     # Add the main changes as an item
                     if changes:
                         # Clean HTML from changes
-                        changes_text = re.sub(r'<[^>]+>', ' ', changes).strip()
+                        changes_text = _TAG_RE.sub(' ', changes).strip()
                         changes_text = re.sub(r'\\/', '/', changes_text)  # Unescape slashes
                         if changes_text:
                             items.append({
@@ -1709,20 +2499,20 @@ class ReleaseNotesScraper:
                             })
                     
                     # Parse accordion items (Improvements, Fixes, Patches)
-                    item_pattern = re.compile(r'\{title:\s*"([^"]+)"[^}]*accordion_items:\s*\[(.*?)\]\s*\}', re.DOTALL)
                     for item_title, accordion_items in item_pattern.findall(items_str):
+                        # The category depends only on the accordion title
+                        title_key = item_title.lower()
+                        category = 'update'
+                        if title_key == 'improvements':
+                            category = 'ga'
+                        elif title_key == 'fixes':
+                            category = 'fixed'
+                        elif title_key == 'patches':
+                            category = 'fixed'
+                        
                         # Extract individual accordion items
-                        text_pattern = re.compile(r'\{text:\s*"([^"]+)"\}')
                         for item_text in text_pattern.findall(accordion_items):
                             if item_text:
-                                category = 'update'
-                                if item_title.lower() == 'improvements':
-                                    category = 'ga'
-                                elif item_title.lower() == 'fixes':
-                                    category = 'fixed'
-                                elif item_title.lower() == 'patches':
-                                    category = 'fixed'
-                                
                                 items.append({
                                     'text': f"[{item_title}] {item_text}",
                                     'category': category,
@@ -1733,6 +2523,7 @@ class ReleaseNotesScraper:
                         releases.append({
                             'date': parsed_date,
                             'date_str': date_str.strip(),
+                            'service': self.service_name,
                             'items': items,
                             'url': self.url
                         })
@@ -1795,6 +2586,7 @@ class ReleaseNotesScraper:
                 releases.append({
                     'date': parsed_date,
                     'date_str': date_str,
+                    'service': self.service_name,
                     'items': items,
                     'url': self.url
                 })
@@ -1819,11 +2611,34 @@ class ReleaseNotesScraper:
         
         return None
 
+    def _element_links(self, element) -> List[str]:
+        """Return the non-empty hrefs of the links inside an HTML element."""
+        # href=True lets BeautifulSoup skip anchors without one during the walk
+        return [a['href'] for a in element.find_all('a', href=True) if a['href']]
+    
+    def _element_item(self, element, min_length: int = 0, normalize: bool = True) -> Optional[Dict]:
+        """Build a release item from an HTML element (None if its text is min_length chars or shorter).
+        
+        The text is extracted once, and the element is only serialized and
+        scanned for links after it passes the length check.
+        """
+        text = element.get_text(strip=True)
+        if len(text) <= min_length:
+            return None
+        links = self._element_links(element)
+        return {
+            'text': str(element),
+            'category': self._categorize_item(element=element, text=text),
+            'urls': self._normalize_urls(links) if normalize else links
+        }
+    
     def _parse_firebase_releases(self, content_area, selectors):
         """Parse Firebase-specific release notes format."""
         # Firebase uses a different structure - look for version headers
         # Common patterns: "Version X.Y.Z - Month DD, YYYY" or just date headers
         
+        date_regex = self.DATE_REGEXES[self.platform]
+        
         # First, try to find version sections (h2/h3 with version numbers)
         for header_tag in ['h2', 'h3', 'h4']:
             headers = content_area.find_all(header_tag)
@@ -1836,12 +2651,10 @@ class ReleaseNotesScraper:
                 date_found = None
                 date_str = None
                 
-                for pattern in selectors['date_patterns']:
-                    match = re.search(pattern, header_text)
-                    if match:
-                        date_str = match.group(1)
-                        date_found = self._parse_date(date_str)
-                        break
+                match = date_regex.search(header_text)
+                if match:
+                    date_str = match.group(0)
+                    date_found = self._parse_date(date_str)
                 
                 if date_found:
                     # Collect all content after this header until next same-level header
@@ -1852,36 +2665,18 @@ class ReleaseNotesScraper:
                         # Check for list items
                         if sibling.name in ['ul', 'ol']:
                             for li in sibling.find_all('li', recursive=False):
-                                text = li.get_text(strip=True)
-                                html_content = str(li)
-                                links = [a.get('href') for a in li.find_all('a') if a.get('href')]
-                                if text and len(text) > 5:
-                                    items.append({
-                                        'text': html_content,
-                                        'category': self._categorize_item(element=li, text=text),
-                                        'urls': links
-                                    })
+                                item = self._element_item(li, min_length=5, normalize=False)
+                                if item:
+                                    items.append(item)
                         elif sibling.name == 'li':
-                            text = sibling.get_text(strip=True)
-                            html_content = str(sibling)
-                            links = [a.get('href') for a in sibling.find_all('a') if a.get('href')]
-                            if text and len(text) > 5:
-                                items.append({
-                                    'text': html_content,
-                                    'category': self._categorize_item(element=sibling, text=text),
-                                    'urls': links
-                                })
+                            item = self._element_item(sibling, min_length=5, normalize=False)
+                            if item:
+                                items.append(item)
                         elif sibling.name in ['p', 'div']:
-                            text = sibling.get_text(strip=True)
                             # Skip short divs or empty paragraphs
-                            if text and len(text) > 10:
-                                html_content = str(sibling)
-                                links = [a.get('href') for a in sibling.find_all('a') if a.get('href')]
-                                items.append({
-                                    'text': html_content,
-                                    'category': self._categorize_item(element=sibling, text=text),
-                                    'urls': links
-                                })
+                            item = self._element_item(sibling, min_length=10, normalize=False)
+                            if item:
+                                items.append(item)
                         
                         sibling = sibling.find_next_sibling()
                     
@@ -1892,15 +2687,9 @@ class ReleaseNotesScraper:
                         if parent_section:
                             for ul in parent_section.find_all(['ul', 'ol']):
                                 for li in ul.find_all('li', recursive=False):
-                                    text = li.get_text(strip=True)
-                                    html_content = str(li)
-                                    links = [a.get('href') for a in li.find_all('a') if a.get('href')]
-                                    if text and len(text) > 5:
-                                        items.append({
-                                            'text': html_content,
-                                            'category': self._categorize_item(element=li, text=text),
-                                            'urls': links
-                                        })
+                                    item = self._element_item(li, min_length=5, normalize=False)
+                                    if item:
+                                        items.append(item)
                     
                     # If still no items, use the header text itself as a release note
                     if not items and len(header_text) > 15:
@@ -1914,6 +2703,7 @@ class ReleaseNotesScraper:
                         self.releases.append({
                             'date': date_found,
                             'date_str': date_str,
+                            'service': self.service_name,
                             'items': items,
                             'url': self.url
                         })
@@ -1927,107 +2717,110 @@ class ReleaseNotesScraper:
                 if len(cells) >= 2:
                     # Try to find date in first cell
                     first_cell = cells[0].get_text(strip=True)
-                    for pattern in selectors['date_patterns']:
-                        match = re.search(pattern, first_cell)
-                        if match:
-                            date_str = match.group(1)
-                            date_found = self._parse_date(date_str)
-                            if date_found:
-                                # Use remaining cells as content
-                                content_text = ' '.join(c.get_text(strip=True) for c in cells[1:])
-                                if content_text and len(content_text) > 10:
-                                    links = [a.get('href') for a in row.find_all('a') if a.get('href')]
-                                    links = self._normalize_urls(links)
-                                    self.releases.append({
-                                        'date': date_found,
-                                        'date_str': date_str,
-                                        'items': [{
-                                            'text': content_text,
-                                            'category': self._categorize_item(text=content_text),
-                                            'urls': links
-                                        }],
-                                        'url': self.url
-                                    })
-                            break
+                    match = date_regex.search(first_cell)
+                    if match:
+                        date_str = match.group(0)
+                        date_found = self._parse_date(date_str)
+                        if date_found:
+                            # Use remaining cells as content
+                            content_text = ' '.join(c.get_text(strip=True) for c in cells[1:])
+                            if content_text and len(content_text) > 10:
+                                links = self._element_links(row)
+                                links = self._normalize_urls(links)
+                                self.releases.append({
+                                    'date': date_found,
+                                    'date_str': date_str,
+                                    'service': self.service_name,
+                                    'items': [{
+                                        'text': content_text,
+                                        'category': self._categorize_item(text=content_text),
+                                        'urls': links
+                                    }],
+                                    'url': self.url
+                                })
 
-    def _parse_structured_releases(self, content_area, selectors):
-        """Parse releases with clear date headers."""
+    def _section_elements(self, header, selectors):
+        """Yield (element, min_length) for each candidate item in a date header's section."""
+        sibling = header.find_next_sibling()
+        
+        while sibling and sibling.name != header.name:
+            # Stop if we hit a higher-level header (e.g. h1 when processing h2)
+            if sibling.name in selectors['date_headers'] and sibling.name < header.name:
+                break
+            
+            # Check for specific release divs
+            if not _RELEASE_DIV_CLASSES.isdisjoint(sibling.get('class', ())):
+                yield sibling, 10
+            
+            elif sibling.name in ['p', 'ul', 'ol', 'li', 'div']:
+                if sibling.name in ['ul', 'ol']:
+                    for li in sibling.find_all('li'):
+                        yield li, 0
+                else:
+                    yield sibling, 10
+            sibling = sibling.find_next_sibling()
+    
+    def _parse_structured_releases(self, content_area, selectors, since: Optional[datetime] = None, until: Optional[datetime] = None) -> bool:
+        """Parse releases with clear date headers.
+        
+        Sections dated before since or after until are not built, since they
+        would be filtered out anyway. Returns True if any dated section has
+        items, including those skipped sections.
+        """
+        date_regex = self.DATE_REGEXES[self.platform]
+        since = since or datetime.min
+        until = until or datetime.max
+        found_sections = False
+        
         for header_tag in selectors['date_headers']:
             headers = content_area.find_all(header_tag)
             
             for header in headers:
                 header_text = header.get_text(strip=True)
                 
-                # Try to extract date from header
-                for pattern in selectors['date_patterns']:
-                    match = re.search(pattern, header_text)
-                    if match:
-                        date_str = match.group(1)
-                        parsed_date = self._parse_date(date_str)
-                        
-                        if parsed_date:
-                            # Get content after this header until next header
+                # Try to extract date from header (first date that parses)
+                for match in date_regex.finditer(header_text):
+                    date_str = match.group(0)
+                    parsed_date = self._parse_date(date_str)
+                    
+                    if parsed_date:
+                        # Get content after this header until next header
+                        elements = self._section_elements(header, selectors)
+                        if since <= parsed_date <= until:
                             items = []
-                            sibling = header.find_next_sibling()
-                            
-                            while sibling and sibling.name != header.name:
-                                # Stop if we hit a higher-level header (e.g. h1 when processing h2)
-                                if sibling.name in selectors['date_headers'] and sibling.name < header.name:
-                                    break
-                                
-                                # Check for specific release divs
-                                div_classes = sibling.get('class', [])
-                                if any(cls in ['release-feature', 'release-changed', 'release-announcement', 'release-breaking', 'release-issue'] for cls in div_classes):
-                                    text_content = str(sibling) # Get full HTML
-                                    text = sibling.get_text(strip=True)
-                                    links = [a.get('href') for a in sibling.find_all('a') if a.get('href')]
-                                    links = self._normalize_urls(links)
-                                    if text and len(text) > 10:
-                                        items.append({
-                                            'text': text_content,
-                                            'category': self._categorize_item(element=sibling, text=text),
-                                            'urls': links
-                                        })
-                                
-                                elif sibling.name in ['p', 'ul', 'ol', 'li', 'div']:
-                                    if sibling.name in ['ul', 'ol']:
-                                        for li in sibling.find_all('li'):
-                                            text_content = str(li)
-                                            li_text = li.get_text(strip=True)
-                                            li_links = [a.get('href') for a in li.find_all('a') if a.get('href')]
-                                            li_links = self._normalize_urls(li_links)
-                                            if li_text:
-                                                items.append({
-                                                    'text': text_content,
-                                                    'category': self._categorize_item(element=li, text=li_text),
-                                                    'urls': li_links
-                                                })
-                                    else:
-                                        text_content = str(sibling)
-                                        text = sibling.get_text(strip=True)
-                                        links = [a.get('href') for a in sibling.find_all('a') if a.get('href')]
-                                        links = self._normalize_urls(links)
-                                        if text and len(text) > 10:
-                                            items.append({
-                                                'text': text_content,
-                                                'category': self._categorize_item(element=sibling, text=text),
-                                                'urls': links
-                                            })
-                                sibling = sibling.find_next_sibling()
+                            for element, min_length in elements:
+                                item = self._element_item(element, min_length=min_length)
+                                if item:
+                                    items.append(item)
                             
                             if items:
+                                found_sections = True
                                 self.releases.append({
                                     'date': parsed_date,
                                     'date_str': date_str,
+                                    'service': self.service_name,
                                     'items': items,
                                     'url': self.url
                                 })
-                            break
+                        elif not found_sections:
+                            # Only the text length is needed to know the section has items
+                            found_sections = any(
+                                len(element.get_text(strip=True)) > min_length
+                                for element, min_length in elements
+                            )
+                        break
+        
+        return found_sections
     
     def _parse_unstructured_releases(self, content_area, selectors):
         """Parse releases without clear structure."""
+        date_regex = self.DATE_REGEXES[self.platform]
+        
+        # HTML of every item collected so far, for constant-time duplicate checks
+        seen_texts = {item['text'] for release in self.releases for item in release.get('items', [])}
+        
         # Look for specific release divs first
-        release_divs = content_area.find_all('div', class_=['release-feature', 'release-changed', 'release-announcement', 'release-breaking', 'release-issue'])
+        release_divs = content_area.find_all('div', class_=_RELEASE_DIV_CLASSES)
         for div in release_divs:
             # Try to find a date near this div
             parent = div.parent
@@ -2038,33 +2831,26 @@ class ReleaseNotesScraper:
             for elem in [div.previous_sibling, parent, div.next_sibling]:
                 if elem and hasattr(elem, 'get_text'):
                     text = elem.get_text(strip=True)
-                    for pattern in selectors['date_patterns']:
-                        match = re.search(pattern, text)
-                        if match:
-                            date_str = match.group(1)
-                            date_found = self._parse_date(date_str)
-                            break
+                    match = date_regex.search(text)
+                    if match:
+                        date_str = match.group(0)
+                        date_found = self._parse_date(date_str)
                 if date_found:
                     break
             
             if date_found and date_found >= self.cutoff_date:
-                text_content = str(div)
                 text = div.get_text(strip=True)
-                links = [a.get('href') for a in div.find_all('a') if a.get('href')]
-                links = self._normalize_urls(links)
                 if text and len(text) > 20:
+                    text_content = str(div)
                     # Check if we already have this content
-                    is_duplicate = False
-                    for release in self.releases:
-                        for item in release.get('items', []):
-                            if item['text'] == text_content:
-                                is_duplicate = True
-                                break
-                    
-                    if not is_duplicate:
+                    if text_content not in seen_texts:
+                        seen_texts.add(text_content)
+                        links = self._element_links(div)
+                        links = self._normalize_urls(links)
                         self.releases.append({
                             'date': date_found,
                             'date_str': date_str,
+                            'service': self.service_name,
                             'items': [{
                                 'text': text_content,
                                 'category': self._categorize_item(element=div, text=text),
@@ -2073,44 +2859,33 @@ class ReleaseNotesScraper:
                             'url': self.url
                         })
     
-        # Continue with existing text-based parsing
-        all_text_elements = content_area.find_all(string=True)
-        
-        for nav_string in all_text_elements:
-            text_str = str(nav_string).strip()
-            if not text_str:
-                continue
-                
-            for pattern in selectors['date_patterns']:
-                matches = re.findall(pattern, text_str)
-                for match in matches:
-                    parsed_date = self._parse_date(match)
-                    if parsed_date and parsed_date >= self.cutoff_date:
-                        parent = nav_string.parent
-                        if parent and parent.name not in ['script', 'style']:
+        # Continue with existing text-based parsing, over only the text nodes
+        # that contain a date (BeautifulSoup applies the regex during its walk)
+        for nav_string in content_area.find_all(string=date_regex):
+            for date_match in date_regex.finditer(nav_string):
+                match = date_match.group(0)
+                parsed_date = self._parse_date(match)
+                if parsed_date and parsed_date >= self.cutoff_date:
+                    parent = nav_string.parent
+                    if parent and parent.name not in ['script', 'style']:
+                        content = parent.get_text(strip=True)
+                        if content and len(content) > 20:
                             text_content = str(parent)
-                            content = parent.get_text(strip=True)
-                            links = [a.get('href') for a in parent.find_all('a') if a.get('href')]
-                            links = self._normalize_urls(links)
-                            if content and len(content) > 20:
-                                is_duplicate = False
-                                for release in self.releases:
-                                    for item in release.get('items', []):
-                                        if item['text'] == text_content:
-                                            is_duplicate = True
-                                            break
-                                
-                                if not is_duplicate:
-                                    self.releases.append({
-                                        'date': parsed_date,
-                                        'date_str': match,
-                                        'items': [{
-                                            'text': text_content,
-                                            'category': self._categorize_item(element=parent, text=content),
-                                            'urls': links
-                                        }],
-                                        'url': self.url
-                                    })
+                            if text_content not in seen_texts:
+                                seen_texts.add(text_content)
+                                links = self._element_links(parent)
+                                links = self._normalize_urls(links)
+                                self.releases.append({
+                                    'date': parsed_date,
+                                    'date_str': match,
+                                    'service': self.service_name,
+                                    'items': [{
+                                        'text': text_content,
+                                        'category': self._categorize_item(element=parent, text=content),
+                                        'urls': links
+                                    }],
+                                    'url': self.url
+                                })
     
     def _strip_html_tags(self, text: str) -> str:
         """Strip HTML tags from text using regex as a fallback."""
@@ -2124,10 +2899,10 @@ class ReleaseNotesScraper:
         
         # Strip HTML tags using regex
         # Handle style attributes with quotes
-        text = re.sub(r'<[^>]+>', ' ', text)
+        text = _TAG_RE.sub(' ', text)
         
         # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         return text.strip()
     
@@ -2162,7 +2937,13 @@ class ReleaseNotesScraper:
         return normalized
     
     def format_output(self, releases: List[Dict], format_type: str) -> str:
-        """Format the scraped releases based on the specified format."""
+        """Format the scraped releases based on the specified format.
+        
+        Releases are sorted newest first here, once, so the formatters get
+        sorted input and the caller's list is left untouched.
+        """
+        releases = sorted(releases, key=_release_sort_key, reverse=True)
+        
         if format_type == 'json':
             return self._format_json(releases)
         elif format_type == 'markdown':
@@ -2172,44 +2953,32 @@ class ReleaseNotesScraper:
         else:
             return self._format_text(releases)
     
+    def write_output(self, releases: List[Dict], format_type: str, file) -> None:
+        """Write the formatted releases to an open text file.
+        
+        JSON is encoded straight into the file (as UTF-8 bytes with orjson,
+        chunk by chunk with json.dump), rather than built as one string first.
+        """
+        if format_type == 'json':
+            releases = sorted(releases, key=_release_sort_key, reverse=True)
+            document = self._json_document(releases)
+            if orjson is not None and hasattr(file, 'buffer'):
+                # orjson encodes straight to UTF-8 bytes; flush so they land
+                # after anything already written through the text layer
+                file.flush()
+                file.buffer.write(orjson.dumps(document, option=orjson.OPT_INDENT_2))
+            else:
+                json.dump(document, file, indent=2)
+        else:
+            file.write(self.format_output(releases, format_type))
+    
     def _clean_text(self, html_text: str) -> str:
         """Clean HTML text and add proper spacing."""
-        import html as html_module
-        
-        # First unescape any HTML entities (handles double-encoded content)
-        unescaped = html_module.unescape(html_text)
-        
-        # Parse HTML and get text
-        soup = self.BeautifulSoup(unescaped, 'html.parser')
-        
-        # Remove script and style elements
-        for element in soup(['script', 'style']):
-            element.decompose()
-        
-        # Get text with separator to preserve word boundaries
-        text = soup.get_text(separator=' ', strip=True)
-        
-        # Fallback: If text still contains HTML-like tags, strip them with regex
-        # This handles cases where BeautifulSoup doesn't recognize malformed HTML
-        if '<' in text and '>' in text:
-            text = re.sub(r'<[^>]+>', ' ', text)
-        
-        # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Fix common spacing issues from HTML parsing
-        # Add space after colons that are followed by uppercase letters
-        text = re.sub(r':([A-Z])', r': \1', text)
-        # Add space after periods that are followed by uppercase letters
-        text = re.sub(r'\.([A-Z])', r'. \1', text)
-        # Fix "See X" patterns that got merged
-        text = re.sub(r'([a-z])See ', r'\1. See ', text)
-        text = re.sub(r'([a-z])For ', r'\1. For ', text)
-        
-        # Remove specific URLs that clutter output
-        text = text.replace('https://cloud.google.com/run/docs/release-notes', '')
-        
-        return text.strip()
+        return _clean_html_text(html_text)
+    
+    def _plain_text(self, html_text: str) -> str:
+        """Plain text of an item's HTML for the Markdown and JSON reports."""
+        return _html_plain_text(html_text)
     
     def _format_text(self, releases: List[Dict]) -> str:
         """Format releases as plain text with improved readability."""
@@ -2218,18 +2987,18 @@ class ReleaseNotesScraper:
         # Header
         output.append("")
         output.append("╔" + "═" * 78 + "╗")
-        output.append("║" + " RELEASE NOTES SUMMARY ".center(78) + "║")
+        output.append(_TEXT_TITLE_ROW)
         output.append("╠" + "═" * 78 + "╣")
-        output.append("║" + f"  Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}".ljust(78) + "║")
-        if hasattr(self, 'group_name') and self.group_name:
-            output.append("║" + f"  Service Group: {self.group_name} ({len(self.service_names)} services)".ljust(78) + "║")
+        output.append(_TEXT_BANNER_ROW(f"  Generated: {self.generated_str}"))
+        if self.group_name:
+            output.append(_TEXT_BANNER_ROW(f"  Service Group: {self.group_name} ({len(self.service_names)} services)"))
         if self.start_date:
-            end_str = self.end_date.strftime('%Y-%m-%d') if self.end_date else 'today'
-            output.append("║" + f"  Date Range: {self.start_date.strftime('%Y-%m-%d')} to {end_str}".ljust(78) + "║")
+            end_str = self.end_date.date().isoformat() if self.end_date else 'today'
+            output.append(_TEXT_BANNER_ROW(f"  Date Range: {self.start_date.date().isoformat()} to {end_str}"))
         elif self.days:
-            output.append("║" + f"  Time Range: Last {self.days} day(s)".ljust(78) + "║")
+            output.append(_TEXT_BANNER_ROW(f"  Time Range: Last {self.days} day(s)"))
         else:
-            output.append("║" + f"  Time Range: Last {self.months} month(s)".ljust(78) + "║")
+            output.append(_TEXT_BANNER_ROW(f"  Time Range: Last {self.months} month(s)"))
         output.append("╚" + "═" * 78 + "╝")
         output.append("")
         
@@ -2237,8 +3006,8 @@ class ReleaseNotesScraper:
             output.append("  No releases found in the specified time range.")
             return "\n".join(output)
         
-        # Sort releases by date (newest first)
-        releases.sort(key=lambda x: x['date'] if x['date'] else datetime.min, reverse=True)
+        # One wrapper for every item; only its prefix and width change per item
+        wrapper = textwrap.TextWrapper(break_on_hyphens=False, break_long_words=False)
         
         # Group releases by date
         current_date = None
@@ -2251,12 +3020,11 @@ class ReleaseNotesScraper:
                 current_date = date_str
                 output.append("")
                 output.append("┌" + "─" * 78 + "┐")
-                # Use ljust(77) to account for emoji 📅 being 2 columns wide but 1 character
-                output.append("│" + f"  📅 {date_str}".ljust(77) + "│")
+                output.append(_TEXT_EMOJI_ROW(f"  📅 {date_str}"))
                 output.append("└" + "─" * 78 + "┘")
             
             # Print service subheader for group queries
-            if hasattr(self, 'group_name') and self.group_name and service:
+            if self.group_name and service:
                 output.append(f"\n  ▸ {service}")
                 output.append("  " + "─" * 40)
             
@@ -2265,105 +3033,59 @@ class ReleaseNotesScraper:
                 category = item['category'].upper()
                 
                 # Category emoji/icon mapping for visual distinction
-                category_icons = {
-                    'GA': '✅',
-                    'PUBLIC-PREVIEW': '🔮',
-                    'BREAKING': '⚠️ ',
-                    'SECURITY': '🔒',
-                    'DEPRECATED': '⛔',
-                    'FIXED': '🔧',
-                    'ISSUE': '🐛',
-                    'CHANGE': '🔄',
-                    'ANNOUNCEMENT': '📢',
-                    'LIBRARIES': '📦',
-                    'UPDATE': '📝',
-                }
-                icon = category_icons.get(category, '•')
+                icon = _CATEGORY_ICONS.get(category, '•')
                 
                 # Format category badge
                 badge = f"[{category}]"
                 
                 # Add source/service name for blog items if we're in blog mode
-                if hasattr(self, 'group_name') and self.group_name == 'Google Blogs' and service:
-                    display_service = service
+                if self.group_name == 'Google Blogs' and service:
                     # Map internal service names to friendlier names
-                    service_map = {
-                        'app-dev': 'App Dev',
-                        'app-mod': 'App Mod',
-                        'infra': 'Infra',
-                        'containers': 'Containers',
-                        'ai-ml': 'AI/ML',
-                        'dev-blog': 'Dev Blog',
-                    }
-                    if service in service_map:
-                        display_service = service_map[service]
+                    display_service = _BLOG_DISPLAY_NAMES.get(service, service)
                     badge = f"{badge} [{display_service}]"
                 
                 # Word wrap long text
                 max_width = 70
                 prefix = f"    {icon} {badge} "
-                indent = " " * len(prefix)
+                wrapper.width = max_width + len(prefix)
+                wrapper.initial_indent = prefix
+                wrapper.subsequent_indent = " " * len(prefix)
                 
                 # Wrap text
-                words = text.split()
-                lines = []
-                current_line = prefix
-                
-                for word in words:
-                    if len(current_line) + len(word) + 1 <= max_width + len(prefix):
-                        if current_line == prefix:
-                            current_line += word
-                        else:
-                            current_line += " " + word
-                    else:
-                        lines.append(current_line)
-                        current_line = indent + word
-                
-                if current_line.strip():
-                    lines.append(current_line)
-                
-                for line in lines:
-                    output.append(line)
+                text = _LONG_TOKEN_RE.sub(lambda m: m.group(0)[:117] + '...', text)
+                output.extend(wrapper.wrap(text) or [prefix])
                 
                 # Add links if present (compact format)
-                if item.get('urls'):
-                    urls = item['urls'][:3]  # Limit to 3 links
-                    if urls:
-                        output.append(f"         ↳ See: {urls[0]}")
-                        if len(urls) > 1:
-                            for url in urls[1:]:
-                                output.append(f"              {url}")
+                urls = item.get('urls')
+                if urls:
+                    # Limit to 3 links
+                    output.append(f"         ↳ See: {urls[0]}")
+                    output.extend(f"              {url}" for url in islice(urls, 1, 3))
                 
                 output.append("")  # Blank line between items
         
         # Statistics section
-        output.append("")
-        output.append("┌" + "─" * 78 + "┐")
-        # Use ljust(77) to account for emoji 📊 being 2 columns wide but 1 character
-        output.append("│" + "  📊 STATISTICS".ljust(77) + "│")
-        output.append("├" + "─" * 78 + "┤")
-        
-        total_items = sum(len(r['items']) for r in releases)
-        output.append("│" + f"  Total Releases: {len(releases)}".ljust(78) + "│")
-        output.append("│" + f"  Total Items: {total_items}".ljust(78) + "│")
-        output.append("│" + "".ljust(78) + "│")
-        
-        # Count by category
-        category_counts = {}
-        for release in releases:
-            for item in release['items']:
-                category = item['category']
-                category_counts[category] = category_counts.get(category, 0) + 1
-        
-        if category_counts:
-            output.append("│" + "  By Category:".ljust(78) + "│")
-            for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
-                bar_width = min(count * 2, 30)
-                bar = "█" * bar_width
-                output.append("│" + f"    {category:<15} {count:>3} {bar}".ljust(78) + "│")
-        
-        output.append("└" + "─" * 78 + "┘")
-        output.append("")
+        if self.show_stats:
+            output.append("")
+            output.append("┌" + "─" * 78 + "┐")
+            output.append(_TEXT_EMOJI_ROW("  📊 STATISTICS"))
+            output.append("├" + "─" * 78 + "┤")
+            
+            total_items, category_counts = _release_stats(releases)
+            output.append(_TEXT_BOX_ROW(f"  Total Releases: {len(releases)}"))
+            output.append(_TEXT_BOX_ROW(f"  Total Items: {total_items}"))
+            output.append(_TEXT_BOX_ROW(""))
+            
+            # Count by category
+            if category_counts:
+                output.append(_TEXT_BOX_ROW("  By Category:"))
+                for category, count in category_counts.most_common():
+                    bar_width = min(count * 2, 30)
+                    bar = "█" * bar_width
+                    output.append(_TEXT_BOX_ROW(f"    {category:<15} {count:>3} {bar}"))
+            
+            output.append("└" + "─" * 78 + "┘")
+            output.append("")
         
         return "\n".join(output)
     
@@ -2371,15 +3093,15 @@ class ReleaseNotesScraper:
         """Format releases as Markdown, extracting URLs from the text."""
         output = []
         output.append("# Release Notes Summary\n")
-        if hasattr(self, 'group_name') and self.group_name:
+        if self.group_name:
             output.append(f"**Service Group:** {self.group_name}  ")
             output.append(f"**Services:** {', '.join(sorted(self.service_names))}  ")
         else:
             output.append(f"**Source:** [{self.url}]({self.url})  ")
-        output.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  ")
+        output.append(f"**Generated:** {self.generated_str}  ")
         if self.start_date:
-            end_str = self.end_date.strftime('%Y-%m-%d') if self.end_date else 'today'
-            output.append(f"**Date range:** {self.start_date.strftime('%Y-%m-%d')} to {end_str}\n")
+            end_str = self.end_date.date().isoformat() if self.end_date else 'today'
+            output.append(f"**Date range:** {self.start_date.date().isoformat()} to {end_str}\n")
         else:
             output.append(f"**Time range:** Last {self.months} months\n")
         output.append("---\n")
@@ -2388,58 +3110,51 @@ class ReleaseNotesScraper:
             output.append("*No releases found in the specified time range.*")
             return "\n".join(output)
         
-        # Sort releases by date (newest first)
-        releases.sort(key=lambda x: x['date'] if x['date'] else datetime.min, reverse=True)
-        
         for release in releases:
-            service_badge = f" `{release.get('service', '')}`" if release.get('service') and hasattr(self, 'group_name') and self.group_name else ""
+            service_badge = f" `{release.get('service', '')}`" if release.get('service') and self.group_name else ""
             output.append(f"\n## {release['date_str']}{service_badge}\n")
             for item in release['items']:
                 # Use BeautifulSoup to get plain text, and remove the specific URL
-                text = self.BeautifulSoup(item['text'], 'html.parser').get_text(strip=True)
-                text = text.replace('https://cloud.google.com/run/docs/release-notes', '')
+                text = self._plain_text(item['text'])
                 badge = f"`{item['category']}`"
                 output.append(f"- {badge} {text}")
-                if item.get('urls'):
-                    for url in item['urls']:
-                        output.append(f"  - [Link]({url})")
+                urls = item.get('urls')
+                if urls:
+                    output.extend(f"  - [Link]({url})" for url in urls)
             output.append("")
         
         # Add statistics
-        output.append("\n---\n")
-        output.append("## Statistics\n")
-        output.append(f"- **Total releases:** {len(releases)}")
-        
-        total_items = sum(len(r['items']) for r in releases)
-        output.append(f"- **Total items:** {total_items}")
-        
-        # Count by category
-        category_counts = {}
-        for release in releases:
-            for item in release['items']:
-                category = item['category']
-                category_counts[category] = category_counts.get(category, 0) + 1
-        
-        if category_counts:
-            output.append("\n### Items by category\n")
-            for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
-                output.append(f"- `{category}`: {count}")
+        if self.show_stats:
+            output.append("\n---\n")
+            output.append("## Statistics\n")
+            output.append(f"- **Total releases:** {len(releases)}")
+            
+            total_items, category_counts = _release_stats(releases)
+            output.append(f"- **Total items:** {total_items}")
+            
+            # Count by category
+            if category_counts:
+                output.append("\n### Items by category\n")
+                for category, count in category_counts.most_common():
+                    output.append(f"- `{category}`: {count}")
         
         return "\n".join(output)
     
     def _format_json(self, releases: List[Dict]) -> str:
         """Format releases as JSON, extracting URLs from the text."""
-        # Sort releases by date (newest first)
-        releases.sort(key=lambda x: x['date'] if x['date'] else datetime.min, reverse=True)
-        
+        if orjson is not None:
+            return orjson.dumps(self._json_document(releases), option=orjson.OPT_INDENT_2).decode('utf-8')
+        return json.dumps(self._json_document(releases), indent=2)
+    
+    def _json_document(self, releases: List[Dict]) -> Dict:
+        """Build the JSON report as plain data, ready for json.dump(s)."""
         # Convert datetime objects to strings for JSON serialization
         json_releases = []
         for release in releases:
             json_items = []
             for item in release['items']:
                 # Use BeautifulSoup to get plain text for JSON, and remove the specific URL
-                text = self.BeautifulSoup(item['text'], 'html.parser').get_text(strip=True)
-                text = text.replace('https://cloud.google.com/run/docs/release-notes', '')
+                text = self._plain_text(item['text'])
                 json_item = {
                     'text': text,
                     'category': item['category'],
@@ -2458,242 +3173,130 @@ class ReleaseNotesScraper:
         output = {
             'metadata': {
                 'source': self.url,
-                'generated': datetime.now().isoformat(),
+                'generated': self.now.isoformat(),
                 'time_range_months': self.months,
                 'cutoff_date': self.cutoff_date.isoformat()
-            },
-            'statistics': {
+            }
+        }
+        if self.show_stats:
+            output['statistics'] = {
                 'total_releases': len(releases),
                 'total_items': sum(len(r['items']) for r in releases)
-            },
-            'releases': json_releases
-        }
+            }
+        output['releases'] = json_releases
         
-        return json.dumps(output, indent=2)
+        return output
     
     def _format_html(self, releases: List[Dict]) -> str:
         """Format releases as HTML with URLs included."""
-        # Sort releases by date (newest first)
-        releases.sort(key=lambda x: x['date'] if x['date'] else datetime.min, reverse=True)
-        
-        html = []
-        html.append('<!DOCTYPE html>')
-        html.append('<html lang="en">')
-        html.append('<head>')
-        html.append('    <meta charset="UTF-8">')
-        html.append('    <meta name="viewport" content="width=device-width, initial-scale=1.0">')
-        html.append('    <title>Release Notes Summary</title>')
-        html.append('    <style>')
-        html.append('        body {')
-        html.append('            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;')
-        html.append('            line-height: 1.6;')
-        html.append('            max-width: 1200px;')
-        html.append('            margin: 0 auto;')
-        html.append('            padding: 20px;')
-        html.append('            background: #f5f5f5;')
-        html.append('        }')
-        html.append('        .header {')
-        html.append('            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);')
-        html.append('            color: white;')
-        html.append('            padding: 30px;')
-        html.append('            border-radius: 10px;')
-        html.append('            margin-bottom: 30px;')
-        html.append('        }')
-        html.append('        .header h1 {')
-        html.append('            margin: 0;')
-        html.append('            font-size: 2em;')
-        html.append('        }')
-        html.append('        .meta {')
-        html.append('            opacity: 0.9;')
-        html.append('            margin-top: 10px;')
-        html.append('        }')
-        html.append('        .release-date {')
-        html.append('            background: white;')
-        html.append('            border-radius: 8px;')
-        html.append('            padding: 20px;')
-        html.append('            margin-bottom: 20px;')
-        html.append('            box-shadow: 0 2px 4px rgba(0,0,0,0.1);')
-        html.append('        }')
-        html.append('        .release-date h2 {')
-        html.append('            color: #333;')
-        html.append('            margin-top: 0;')
-        html.append('            border-bottom: 2px solid #667eea;')
-        html.append('            padding-bottom: 10px;')
-        html.append('        }')
-        html.append('        .release-item {')
-        html.append('            margin: 15px 0;')
-        html.append('            padding: 10px;')
-        html.append('            background: #f9f9f9;')
-        html.append('            border-left: 4px solid #ccc;')
-        html.append('            border-radius: 4px;')
-        html.append('        }')
-        html.append('        .release-item.ga { border-left-color: #4CAF50; }')
-        html.append('        .release-item.publicpreview { border-left-color: #FF9800; }')
-        html.append('        .release-item.change { border-left-color: #2196F3; }')
-        html.append('        .release-item.announcement { border-left-color: #9C27B0; }')
-        html.append('        .release-item.breaking { border-left-color: #f44336; }')
-        html.append('        .release-item.deprecated { border-left-color: #f44336; }')
-        html.append('        .release-item.fixed { border-left-color: #00BCD4; }')
-        html.append('        .release-item.update { border-left-color: #795548; }')
-        html.append('        .release-item.libraries { border-left-color: #607D8B; }')
-        html.append('        .release-item.security { border-left-color: #E91E63; }')
-        html.append('        .release-item.issue { border-left-color: #ffc107; }')
-        html.append('        .category {')
-        html.append('            display: inline-block;')
-        html.append('            padding: 2px 8px;')
-        html.append('            border-radius: 3px;')
-        html.append('            font-size: 0.85em;')
-        html.append('            font-weight: bold;')
-        html.append('            margin-right: 10px;')
-        html.append('        }')
-        html.append('        .category.ga { background: #4CAF50; color: white; }')
-        html.append('        .category.publicpreview { background: #FF9800; color: white; }')
-        html.append('        .category.change { background: #2196F3; color: white; }')
-        html.append('        .category.announcement { background: #9C27B0; color: white; }')
-        html.append('        .category.breaking { background: #E91E63; color: white; }')
-        html.append('        .category.deprecated { background: #f44336; color: white; }')
-        html.append('        .category.fixed { background: #00BCD4; color: white; }')
-        html.append('        .category.update { background: #795548; color: white; }')
-        html.append('        .category.libraries { background: #607D8B; color: white; }')
-        html.append('        .category.security { background: #E91E63; color: white; }')
-        html.append('        .category.issue { background: #ffc107; color: white; }')
-        html.append('        .stats {')
-        html.append('            background: white;')
-        html.append('            border-radius: 8px;')
-        html.append('            padding: 20px;')
-        html.append('            margin-top: 30px;')
-        html.append('            box-shadow: 0 2px 4px rgba(0,0,0,0.1);')
-        html.append('        }')
-        html.append('        .stats h2 {')
-        html.append('            color: #333;')
-        html.append('            margin-top: 0;')
-        html.append('        }')
-        html.append('        a {')
-        html.append('            color: #667eea;')
-        html.append('            text-decoration: none;')
-        html.append('        }')
-        html.append('        a:hover {')
-        html.append('            text-decoration: underline;')
-        html.append('        }')
-        html.append('        .source-link {')
-        html.append('            margin-top: 20px;')
-        html.append('            text-align: center;')
-        html.append('        }')
-        html.append('        .item-source {')
-        html.append('            font-size: 0.8em;')
-        html.append('            margin-top: 5px;')
-        html.append('            opacity: 0.7;')
-        html.append('        }')
-        html.append('        .no-results {')
-        html.append('            background: #fff3cd;')
-        html.append('            border: 1px solid #ffc107;')
-        html.append('            border-radius: 5px;')
-        html.append('            padding: 20px;')
-        html.append('            margin: 20px 0;')
-        html.append('            text-align: center;')
-        html.append('        }')
-        html.append('    </style>')
-        html.append('</head>')
-        html.append('<body>')
-        html.append('    <div class="header">')
-        html.append('        <h1>Release Notes Summary</h1>')
-        html.append('        <div class="meta">')
-        html.append(f'            <p>Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>')
-        if hasattr(self, 'group_name') and self.group_name:
-            html.append(f'            <p>Service Group: <strong>{self.group_name}</strong> ({len(self.service_names)} services)</p>')
-            html.append(f'            <p>Services: {", ".join(sorted(self.service_names))}</p>')
+        import html as html_module
+        
+        # Lines are written straight into one buffer, each with its leading newline
+        buf = io.StringIO()
+        write = buf.write
+        escape = html_module.escape
+        # -u takes any URL, so it is escaped like the rest of the metadata
+        source_url = escape(self.url)
+        write(_HTML_HEAD)
+        write(f'\n            <p>Generated: {self.generated_str}</p>')
+        if self.group_name:
+            write(f'\n            <p>Service Group: <strong>{escape(self.group_name)}</strong> ({len(self.service_names)} services)</p>')
+            write(f'\n            <p>Services: {escape(", ".join(sorted(self.service_names)))}</p>')
         else:
-            html.append(f'            <p>Source: <a href="{self.url}" style="color: white; text-decoration: underline;">{self.url}</a></p>')
+            write(f'\n            <p>Source: <a href="{source_url}" style="color: white; text-decoration: underline;">{source_url}</a></p>')
         if self.start_date:
-            end_str = self.end_date.strftime('%Y-%m-%d') if self.end_date else 'today'
-            html.append(f'            <p>Date range: {self.start_date.strftime("%Y-%m-%d")} to {end_str}</p>')
+            end_str = self.end_date.date().isoformat() if self.end_date else 'today'
+            write(f'\n            <p>Date range: {self.start_date.date().isoformat()} to {end_str}</p>')
         else:
-            html.append(f'            <p>Time range: Last {self.months} months</p>')
-        html.append('        </div>')
-        html.append('    </div>')
+            write(f'\n            <p>Time range: Last {self.months} months</p>')
+        write('\n        </div>')
+        write('\n    </div>')
         
         if not releases:
-            html.append('    <div class="no-results">')
-            html.append('        <h2>No Release Notes Found</h2>')
-            html.append('        <p>No release notes were found in the specified time range.</p>')
-            html.append('        <p>This could be due to:</p>')
-            html.append('        <ul style="text-align: left; display: inline-block;">')
-            html.append('            <li>No releases in the past ' + str(self.months) + ' months</li>')
-            html.append('            <li>Different page structure than expected</li>')
-            html.append('            <li>Content loaded dynamically via JavaScript</li>')
-            html.append('        </ul>')
-            html.append('    </div>')
+            write('\n    <div class="no-results">')
+            write('\n        <h2>No Release Notes Found</h2>')
+            write('\n        <p>No release notes were found in the specified time range.</p>')
+            write('\n        <p>This could be due to:</p>')
+            write('\n        <ul style="text-align: left; display: inline-block;">')
+            write('\n            <li>No releases in the past ' + str(self.months) + ' months</li>')
+            write('\n            <li>Different page structure than expected</li>')
+            write('\n            <li>Content loaded dynamically via JavaScript</li>')
+            write('\n        </ul>')
+            write('\n    </div>')
         else:
             # Add release notes with URLs
             for release in releases:
-                html.append('    <div class="release-date">')
-                service_badge = f' <span style="background: #667eea; color: white; padding: 2px 8px; border-radius: 3px; font-size: 0.8em; margin-left: 10px;">{release.get("service", "")}</span>' if release.get('service') and hasattr(self, 'group_name') and self.group_name else ""
-                html.append(f'        <h2>{release["date_str"]}{service_badge}</h2>')
+                release_url = release.get('url', self.url)
+                write('\n    <div class="release-date">')
+                service_badge = f' <span style="background: #667eea; color: white; padding: 2px 8px; border-radius: 3px; font-size: 0.8em; margin-left: 10px;">{escape(release["service"])}</span>' if release.get('service') and self.group_name else ""
+                write(f'\n        <h2>{escape(release["date_str"])}{service_badge}</h2>')
                 for item in release['items']:
-                    category_class = item['category'].replace('-', '')
-                    html.append(f'        <div class="release-item {category_class}">')
-                    html.append(f'            <span class="category {category_class}">{item["category"].replace("-", " ").upper()}</span>')
-                    html.append(f'            {item["text"]}') # Use the raw HTML content
-                    html.append('        </div>')
-                html.append('    </div>')
+                    category = item['category']
+                    category_class = _CATEGORY_CSS_CLASSES.get(category) or escape(category.translate(_DASH_TO_EMPTY))
+                    category_label = _CATEGORY_LABELS.get(category) or escape(category.translate(_DASH_TO_SPACE).upper())
+                    # Item text is the feed's own HTML markup: keep its safe formatting
+                    write(_HTML_ITEM.format(category_class, category_label, _sanitize_item_html(item['text'], release_url)))
+                write('\n    </div>')
         
         # Add statistics
-        html.append('    <div class="stats">')
-        html.append('        <h2>Summary Statistics</h2>')
-        html.append(f'        <p><strong>Total Releases:</strong> {len(releases)}</p>')
-        
-        total_items = sum(len(r['items']) for r in releases)
-        html.append(f'        <p><strong>Total Items:</strong> {total_items}</p>')
-        
-        if releases:
-            date_range_start = min(r['date'] for r in releases if r['date'])
-            date_range_end = max(r['date'] for r in releases if r['date'])
-            html.append(f'        <p><strong>Date Range:</strong> {date_range_start.strftime("%Y-%m-%d")} to {date_range_end.strftime("%Y-%m-%d")}</p>')
-        else:
-            cutoff = self.cutoff_date.strftime("%Y-%m-%d")
-            today = datetime.now().strftime("%Y-%m-%d")
-            html.append(f'        <p><strong>Search Range:</strong> {cutoff} to {today}</p>')
-        
-        # Category breakdown
-        if releases:
-            category_counts = {}
-            for release in releases:
-                for item in release['items']:
-                    category = item['category']
-                    category_counts[category] = category_counts.get(category, 0) + 1
+        if self.show_stats:
+            write('\n    <div class="stats">')
+            write('\n        <h2>Summary Statistics</h2>')
+            write(f'\n        <p><strong>Total Releases:</strong> {len(releases)}</p>')
+            
+            total_items, category_counts = _release_stats(releases)
+            write(f'\n        <p><strong>Total Items:</strong> {total_items}</p>')
+            
+            if releases:
+                date_range_start = min(r['date'] for r in releases if r['date'])
+                date_range_end = max(r['date'] for r in releases if r['date'])
+                write(f'\n        <p><strong>Date Range:</strong> {date_range_start.date().isoformat()} to {date_range_end.date().isoformat()}</p>')
+            else:
+                cutoff = self.cutoff_date.date().isoformat()
+                today = self.now.date().isoformat()
+                write(f'\n        <p><strong>Search Range:</strong> {cutoff} to {today}</p>')
             
+            # Category breakdown
             if category_counts:
-                html.append('        <h3>Items by Category</h3>')
-                html.append('        <ul>')
-                for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
-                    display_name = category.replace('-', ' ').title()
-                    if category == 'ga':
-                        display_name = 'GA (Generally Available)'
-                    elif category == 'public-preview':
-                        display_name = 'Public Preview'
-                    elif category == 'breaking':
-                        display_name = 'Breaking'
-                    html.append(f'            <li><strong>{display_name}:</strong> {count}</li>')
-                html.append('        </ul>')
-        
-        html.append('    </div>')
-        
-        html.append('    <div class="source-link">')
-        html.append(f'        <a href="{self.url}" target="_blank">View Full Release Notes</a>')
-        html.append('    </div>')
-        html.append('</body>')
-        html.append('</html>')
-        
-        return '\n'.join(html)
+                write('\n        <h3>Items by Category</h3>')
+                write('\n        <ul>')
+                for category, count in category_counts.most_common():
+                    display_name = _CATEGORY_DISPLAY_NAMES.get(category) or category.translate(_DASH_TO_SPACE).title()
+                    write(f'\n            <li><strong>{display_name}:</strong> {count}</li>')
+                write('\n        </ul>')
+            
+            write('\n    </div>')
+        
+        write('\n    <div class="source-link">')
+        write(f'\n        <a href="{source_url}" target="_blank">View Full Release Notes</a>')
+        write('\n    </div>')
+        write('\n</body>')
+        write('\n</html>')
+        
+        return buf.getvalue()
+
+# (platform, is_xml_feed) for every built-in source URL, classified once at import
+_URL_META = {
+    url: (ReleaseNotesScraper._detect_platform(url), ReleaseNotesScraper._is_xml_url(url))
+    for url in (*SERVICE_FEEDS.values(), *SERVICE_HTML_FALLBACKS.values(), *BLOG_URLS.values())
+}
+
+
+async def fetch_all(scrapers: List[ReleaseNotesScraper]) -> List[List[Dict]]:
+    """Scrape all sources concurrently, returning results in the order given."""
+    if len(scrapers) == 1:
+        # Nothing to overlap with; skip the thread hand-off for single-source runs
+        return [scrapers[0].scrape()]
+    
+    # A dedicated pool sized for I/O: the default executor is sized by CPU
+    # count, which caps concurrency at a handful of fetches on small machines
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES, thread_name_prefix='fetch') as executor:
+        return await asyncio.gather(*(loop.run_in_executor(executor, scraper.scrape) for scraper in scrapers))
+
 
 def list_services():
     """Print list of available services with their groups."""
-    # Build reverse lookup: service -> group
-    service_to_group = {}
-    for group, services in SERVICE_GROUPS.items():
-        for service in services:
-            service_to_group[service] = group
-    
     print("Available GCP services:")
     print("-" * 60)
     
@@ -2701,7 +3304,7 @@ def list_services():
     max_len = max(len(s) for s in SERVICE_FEEDS.keys())
     
     for service in sorted(SERVICE_FEEDS.keys()):
-        group = service_to_group.get(service, 'unknown')
+        group = _SERVICE_TO_GROUP.get(service, 'unknown')
         print(f"  {service:<{max_len}}  [{group}]")
     print("-" * 60)
     print(f"Total: {len(SERVICE_FEEDS)} services")
@@ -2775,7 +3378,7 @@ Output formats:
     source_group = parser.add_mutually_exclusive_group()
     source_group.add_argument(
         '-s', '--service',
-        choices=list(SERVICE_FEEDS.keys()),
+        choices=SERVICE_FEEDS,
         metavar='SERVICE',
         help='GCP service name (use --list-services to see all options)'
     )
@@ -2847,6 +3450,32 @@ Output formats:
         help='Output file path (if not specified, prints to stdout)'
     )
     
+    parser.add_argument(
+        '--no-stats',
+        action='store_true',
+        help='Leave the summary statistics out of the output'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always download feeds instead of revalidating the on-disk cache'
+    )
+    
+    parser.add_argument(
+        '--cache-max-age',
+        type=int,
+        default=0,
+        metavar='SECONDS',
+        help='Reuse cached sources fetched within this many seconds without revalidating them (default: 0, always revalidate)'
+    )
+    
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help='Delete all cached feeds and parsed release notes, then exit'
+    )
+    
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -2864,6 +3493,12 @@ Output formats:
         list_groups()
         sys.exit(0)
     
+    if args.clear_cache:
+        cache = FeedCache()
+        removed = cache.clear()
+        print(f"Removed {removed} cached file(s) from {cache.directory}")
+        sys.exit(0)
+    
     # Determine URLs to scrape
     urls = []
     service_names = []
@@ -2922,12 +3557,15 @@ Output formats:
     if start_date and end_date and start_date > end_date:
         parser.error("Start date must be before end date")
     
+    # One "now" for the whole run, so every service gets the same time window
+    now = datetime.now()
+    
     # Handle days/months vs date range
     days = args.days
     months = args.months
     
     # Validate that only one time option is used
-    time_options_count = sum(1 for x in [days, months, start_date] if x is not None)
+    time_options_count = (days is not None) + (months is not None) + (start_date is not None)
     if time_options_count > 1:
         parser.error("Use only one of --days, --months, or --start-date")
     
@@ -2941,6 +3579,9 @@ Output formats:
         group_names = [g.strip() for g in args.group.split(',')]
         group_display = ', '.join(group_names) if len(group_names) > 1 else group_names[0]
     
+    # Per-service progress lines are only shown for verbose multi-source runs
+    verbose_multi = args.verbose and len(urls) > 1
+    
     if args.verbose:
         if len(urls) > 1:
             print(f"Scraping {len(urls)} services in group '{group_display if group_display else 'blogs'}':", file=sys.stderr)
@@ -2949,20 +3590,21 @@ Output formats:
         else:
             print(f"Scraping: {urls[0]}", file=sys.stderr)
         if start_date:
-            print(f"Date range: {start_date.strftime('%Y-%m-%d')} to {(end_date or datetime.now()).strftime('%Y-%m-%d')}", file=sys.stderr)
+            print(f"Date range: {start_date.date().isoformat()} to {(end_date or now).date().isoformat()}", file=sys.stderr)
         elif days:
             print(f"Time range: Last {days} day(s)", file=sys.stderr)
         else:
             print(f"Time range: Last {months} month(s)", file=sys.stderr)
         print(f"Output format: {args.output}", file=sys.stderr)
     
-    # Scrape all URLs and combine results
-    all_releases = []
+    # Scrape all URLs concurrently and combine results
+    cache = None if args.no_cache else FeedCache(max_age=args.cache_max_age)
+    scrapers = []
     for url, service_name in zip(urls, service_names):
-        if args.verbose and len(urls) > 1:
+        if verbose_multi:
             print(f"Fetching: {service_name} ({url})...", file=sys.stderr)
         
-        scraper = ReleaseNotesScraper(
+        scrapers.append(ReleaseNotesScraper(
             url,
             months=months,
             days=days,
@@ -2970,52 +3612,50 @@ Output formats:
             end_date=end_date,
             categories=args.category,
             service_name=service_name,
-            verbose=args.verbose
-        )
-        releases = scraper.scrape()
-        
-        # Add service name to each release for multi-service queries
-        for release in releases:
-            release['service'] = service_name
-        
-        all_releases.extend(releases)
-        
-        if args.verbose and len(urls) > 1:
+            verbose=args.verbose,
+            cache=cache,
+            show_stats=not args.no_stats,
+            now=now
+        ))
+    
+    results = asyncio.run(fetch_all(scrapers))
+    
+    # Releases are already tagged with their scraper's service name; a single
+    # source's list is used as-is
+    all_releases = results[0] if len(results) == 1 else list(chain.from_iterable(results))
+    
+    if verbose_multi:
+        for scraper, releases in zip(scrapers, results):
             fallback_note = " (via HTML fallback)" if scraper.used_fallback else ""
-            print(f"  Found {len(releases)} releases{fallback_note}", file=sys.stderr)
+            print(f"  {scraper.service_name}: found {len(releases)} releases{fallback_note}", file=sys.stderr)
     
     if args.verbose:
         print(f"Total: {len(all_releases)} releases", file=sys.stderr)
     
-    # Create a scraper instance for formatting (uses the last URL for metadata)
-    # For group queries, we'll customize the output
-    format_scraper = ReleaseNotesScraper(urls[0], months=months, days=days, start_date=start_date, end_date=end_date, categories=args.category)
+    # Format with the first scraper: it already holds the URL and date range
+    # the report metadata is built from. For group queries, we'll customize the output
+    format_scraper = scrapers[0]
+    format_scraper.service_names = service_names
     
     # Add group info for formatting
     if args.group:
         format_scraper.group_name = group_display
-        format_scraper.service_names = service_names
     elif args.blogs:
         format_scraper.group_name = 'Google Blogs'
-        format_scraper.service_names = service_names
-    else:
-        format_scraper.group_name = None
-        format_scraper.service_names = service_names
-    
-    # Format output
-    output = format_scraper.format_output(all_releases, args.output)
     
-    # Write output
+    # Format and write output
     if args.file:
         try:
-            with open(args.file, 'w', encoding='utf-8') as f:
-                f.write(output)
+            with open(args.file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+                format_scraper.write_output(all_releases, args.output, f)
             print(f"{args.output.upper()} output saved to {args.file}", file=sys.stderr)
         except IOError as e:
             print(f"Error writing to file: {e}", file=sys.stderr)
             sys.exit(1)
     else:
-        print(output)
+        # Same writer as for files, so JSON is encoded straight into stdout too
+        format_scraper.write_output(all_releases, args.output, sys.stdout)
+        sys.stdout.write('\n')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,257 @@
+"""Tests for changelog.py (run with: python -m unittest discover tests)."""
+
+import contextlib
+import http.server
+import io
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import changelog
+
+
+class CutoffTests(unittest.TestCase):
+    def test_subtract_months_clamps_to_month_length(self):
+        cases = [
+            # (date, months back, expected)
+            (datetime(2024, 3, 31), 1, datetime(2024, 2, 29)),    # into a leap February
+            (datetime(2023, 3, 31), 1, datetime(2023, 2, 28)),    # into a common February
+            (datetime(2024, 2, 29), 12, datetime(2023, 2, 28)),   # leap day, one year back
+            (datetime(2028, 2, 29), 48, datetime(2024, 2, 29)),   # leap day to leap day
+            (datetime(2024, 5, 31), 1, datetime(2024, 4, 30)),    # 31st into a 30-day month
+            (datetime(2024, 1, 15), 1, datetime(2023, 12, 15)),   # across the year boundary
+            (datetime(2024, 3, 31), 4, datetime(2023, 11, 30)),   # boundary plus clamping
+            (datetime(2024, 12, 31), 12, datetime(2023, 12, 31)),
+            (datetime(2025, 10, 16), 12, datetime(2024, 10, 16)),
+            (datetime(2024, 1, 31), 25, datetime(2021, 12, 31)),  # several years back
+            (datetime(2024, 7, 10, 13, 45), 0, datetime(2024, 7, 10, 13, 45)),
+        ]
+        for when, months, expected in cases:
+            with self.subTest(when=when, months=months):
+                self.assertEqual(changelog._subtract_months(when, months), expected)
+    
+    def test_cutoff_for_months_and_days(self):
+        today = datetime(2025, 10, 16)
+        self.assertEqual(changelog._cutoff_for(today, 12, None), datetime(2024, 10, 16))
+        self.assertEqual(changelog._cutoff_for(today, None, 2), datetime(2025, 10, 14))
+        self.assertEqual(changelog._cutoff_for(datetime(2025, 3, 31), 1, None), datetime(2025, 2, 28))
+
+
+class CleanHtmlTextTests(unittest.TestCase):
+    FRAGMENTS = [
+        '<p>Cloud Run <strong>GPU <em>support</em></strong> is <a href="/run/docs/gpu">now GA</a>.</p>',
+        '<ul><li>Fixed a bug.</li><li>The <code>v1</code> API is deprecated.</li></ul>',
+        'First line<br>second line<br/>third line',
+        '<p>Tom &amp; Jerry &lt;3 caf&eacute; &#8212; done&nbsp;now</p>',
+        '&lt;p&gt;Double-encoded &amp;amp; markup&lt;/p&gt;',
+        '<p>Before</p><script>var x = "<b>hidden</b>";</script><style>p { color: red; }</style><p>After</p>',
+        '<div class="release-feature"><h3>Feature</h3><p>Direct VPC egress is available in (Preview).</p></div>',
+    ]
+    
+    def clean_all(self):
+        changelog._clean_html_text.cache_clear()
+        return [changelog._clean_html_text(fragment) for fragment in self.FRAGMENTS]
+    
+    @unittest.skipIf(changelog.LexborHTMLParser is None, 'selectolax is not installed')
+    def test_lexbor_matches_beautifulsoup(self):
+        self.addCleanup(changelog._clean_html_text.cache_clear)
+        lexbor = self.clean_all()
+        with mock.patch.object(changelog, 'LexborHTMLParser', None):
+            soup = self.clean_all()
+        
+        for fragment, lexbor_text, soup_text in zip(self.FRAGMENTS, lexbor, soup):
+            with self.subTest(fragment=fragment):
+                self.assertEqual(lexbor_text, soup_text)
+
+
+class FormatHtmlTests(unittest.TestCase):
+    def test_source_url_is_escaped_in_header_and_footer(self):
+        url = 'https://example.com/notes?a="><script>alert(1)</script>'
+        scraper = changelog.ReleaseNotesScraper(url)
+        
+        output = scraper.format_output([], 'html')
+        
+        self.assertNotIn('<script>', output)
+        escaped = 'https://example.com/notes?a=&quot;&gt;&lt;script&gt;alert(1)&lt;/script&gt;'
+        self.assertIn(f'<p>Source: <a href="{escaped}"', output)
+        self.assertIn(f'<a href="{escaped}" target="_blank">View Full Release Notes</a>', output)
+    
+    def test_item_html_is_sanitized(self):
+        scraper = changelog.ReleaseNotesScraper('https://cloud.google.com/run/docs/release-notes')
+        text = ('<p>New <strong>feature</strong>, see <a href="/run/docs" onclick="steal()">docs</a>'
+                ' and <a href="javascript:alert(1)">this</a>.</p>'
+                '<script>alert(1)</script><img src="x" onerror="alert(2)"><iframe src="https://evil"></iframe>')
+        releases = [{
+            'date': datetime(2024, 5, 1),
+            'date_str': 'May 01, 2024',
+            'items': [{'text': text, 'category': 'feature', 'urls': []}],
+            'url': 'https://cloud.google.com/run/docs/release-notes',
+        }]
+        
+        output = scraper.format_output(releases, 'html')
+        
+        self.assertNotIn('<script>', output)
+        self.assertNotIn('alert(1)', output)
+        self.assertNotIn('onerror', output)
+        self.assertNotIn('onclick', output)
+        self.assertNotIn('<img', output)
+        self.assertNotIn('<iframe', output)
+        self.assertNotIn('javascript:', output)
+        self.assertIn('<p>New <strong>feature</strong>, see '
+                      '<a href="https://cloud.google.com/run/docs">docs</a> and <a>this</a>.</p>', output)
+
+
+class _TruncatedFeedHandler(http.server.BaseHTTPRequestHandler):
+    """Announces a long feed, sends its first bytes, then drops the connection."""
+    
+    def do_GET(self):
+        body = b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><entry><title>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/atom+xml')
+        self.send_header('Content-Length', str(len(body) * 100))
+        self.end_headers()
+        self.wfile.write(body)
+        self.wfile.flush()
+        self.close_connection = True
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class StreamedFeedTests(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.HTTPServer(('127.0.0.1', 0), _TruncatedFeedHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+    
+    def test_truncated_stream_is_reported_as_fetch_error(self):
+        url = f'http://127.0.0.1:{self.server.server_port}/feed.xml'
+        scraper = changelog.ReleaseNotesScraper(url)
+        self.assertIsNone(scraper.cache)
+        
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            releases = scraper.scrape()
+        
+        self.assertEqual(releases, [])
+        self.assertIn('Error fetching URL', stderr.getvalue())
+        self.assertNotIn('Error parsing XML', stderr.getvalue())
+
+
+
+_FEED_BODY = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <title>June 10, 2024</title>
+    <updated>2024-06-10T00:00:00Z</updated>
+    <link rel="alternate" href="https://cloud.google.com/run/docs/release-notes#June_10_2024"/>
+    <content type="html">&lt;p&gt;Cloud Run GPU support is now generally available.&lt;/p&gt;</content>
+  </entry>
+  <entry>
+    <title>March 01, 2024</title>
+    <updated>2024-03-01T00:00:00Z</updated>
+    <link rel="alternate" href="https://cloud.google.com/run/docs/release-notes#March_01_2024"/>
+    <content type="html">&lt;p&gt;Announcing a security patch for the runtime.&lt;/p&gt;</content>
+  </entry>
+</feed>
+"""
+
+
+class _FeedHandler(http.server.BaseHTTPRequestHandler):
+    """Serves one feed with an ETag, answering 304 when it is revalidated."""
+    
+    etag = '"v1"'
+    
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == self.etag:
+            self.server.statuses.append(304)
+            self.send_response(304)
+            self.send_header('ETag', self.etag)
+            self.end_headers()
+            return
+        self.server.statuses.append(200)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/atom+xml')
+        self.send_header('Content-Length', str(len(_FEED_BODY)))
+        self.send_header('ETag', self.etag)
+        self.end_headers()
+        self.wfile.write(_FEED_BODY)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class FeedCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.HTTPServer(('127.0.0.1', 0), _FeedHandler)
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f'http://127.0.0.1:{self.server.server_port}/feed.xml'
+        
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = tmp.name
+    
+    def scrape(self, cache):
+        scraper = changelog.ReleaseNotesScraper(
+            self.url, start_date=datetime(2024, 1, 1), end_date=datetime(2024, 12, 31), cache=cache
+        )
+        return scraper.scrape()
+    
+    def test_not_modified_serves_cached_body_and_parse(self):
+        cache = changelog.FeedCache(self.directory)
+        first = self.scrape(cache)
+        self.assertEqual([r['date_str'] for r in first], ['June 10, 2024', 'March 01, 2024'])
+        
+        with mock.patch.object(changelog.ReleaseNotesScraper, '_parse_xml_entries',
+                               side_effect=AssertionError('feed parsed again')):
+            second = self.scrape(changelog.FeedCache(self.directory))
+        
+        self.assertEqual(self.server.statuses, [200, 304])
+        self.assertEqual(second, first)
+    
+    def test_parse_cached_for_later_window_is_not_served_to_wider_window(self):
+        cache = changelog.FeedCache(self.directory)
+        releases = [{'date': datetime(2024, 6, 10), 'date_str': 'June 10, 2024', 'items': [], 'url': self.url}]
+        cache.store_parsed(self.url, _FEED_BODY, releases, since=datetime(2024, 6, 1))
+        
+        self.assertIsNone(cache.load_parsed(self.url, _FEED_BODY, since=datetime(2024, 1, 1)))
+        self.assertIsNone(cache.load_parsed(self.url, _FEED_BODY, since=None))
+        self.assertEqual(cache.load_parsed(self.url, _FEED_BODY, since=datetime(2024, 7, 1)), releases)
+        self.assertIsNone(cache.load_parsed(self.url, _FEED_BODY + b' ', since=datetime(2024, 7, 1)))
+    
+    def test_fresh_body_skips_request_within_max_age(self):
+        cache = changelog.FeedCache(self.directory, max_age=3600)
+        first = self.scrape(cache)
+        self.assertEqual(self.server.statuses, [200])
+        
+        second = self.scrape(changelog.FeedCache(self.directory, max_age=3600))
+        
+        self.assertEqual(self.server.statuses, [200])
+        self.assertEqual(second, first)
+        self.assertIsNone(changelog.FeedCache(self.directory).fresh_body(self.url))
+    
+    def test_clear_removes_only_cache_files(self):
+        cache = changelog.FeedCache(self.directory)
+        self.scrape(cache)
+        other = os.path.join(self.directory, 'notes.txt')
+        with open(other, 'w') as f:
+            f.write('keep me')
+        
+        removed = cache.clear()
+        
+        self.assertEqual(removed, 3)  # body, metadata and parsed releases
+        self.assertEqual(os.listdir(self.directory), ['notes.txt'])
+
+
+if __name__ == '__main__':
+    unittest.main()